@@ -2,14 +2,14 @@
 
 import asyncio
 import sys
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, nullcontext
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import click
 import structlog
 from ace_skyspark_lib import SkysparkClient
-from aceiot_models.api import APIClient
+from aceiot_models.api import APIClient, AsyncAPIClient
 
 from ace_skyspark_cli.config import Config
 from ace_skyspark_cli.logging import configure_logging, get_logger, log_config
@@ -35,7 +35,9 @@ async def create_clients(config: Config):
         config: Application configuration
 
     Yields:
-        Tuple of (ace_client, skyspark_client)
+        Tuple of (ace_client, skyspark_client, ace_async_client). ace_async_client is
+        None when app.ace_async_http is disabled, in which case ACE calls fall back to
+        the sync client.
     """
     if not logger:
         raise RuntimeError("Logger not initialized")
@@ -55,19 +57,30 @@ async def create_clients(config: Config):
         timeout=config.skyspark.timeout,
     )
 
-    # Create SkySpark client with async context manager
-    async with SkysparkClient(
-        base_url=config.skyspark.url,
-        project=config.skyspark.project,
-        username=config.skyspark.user,
-        password=config.skyspark.password,
-        timeout=config.skyspark.timeout,
-        max_retries=config.skyspark.max_retries,
-        pool_size=config.skyspark.pool_size,
-    ) as skyspark_client:
+    # Create SkySpark client and async ACE client with async context managers
+    async with (
+        (
+            AsyncAPIClient(
+                base_url=config.flightdeck.api_url,
+                api_key=config.flightdeck.jwt,
+                timeout=config.flightdeck.timeout,
+            )
+            if config.app.ace_async_http
+            else nullcontext()
+        ) as ace_async_client,
+        SkysparkClient(
+            base_url=config.skyspark.url,
+            project=config.skyspark.project,
+            username=config.skyspark.user,
+            password=config.skyspark.password,
+            timeout=config.skyspark.timeout,
+            max_retries=config.skyspark.max_retries,
+            pool_size=config.skyspark.pool_size,
+        ) as skyspark_client,
+    ):
         logger.info("skyspark_session_created")
         try:
-            yield (ace_client, skyspark_client)
+            yield (ace_client, skyspark_client, ace_async_client)
         finally:
             logger.info("closing_skyspark_session")
 
@@ -384,18 +397,18 @@ async def _run_sync(
         config.app.batch_size = batch_size
 
     # Create clients with proper session management
-    async with create_clients(config) as (ace_client, skyspark_client):
-        # Create sync service
-        sync_service = PointSyncService(
+    async with create_clients(config) as (ace_client, skyspark_client, ace_async_client):
+        # Create sync service (owns the ACE worker threads for the sync client)
+        async with PointSyncService(
             ace_client=ace_client,
             skyspark_client=skyspark_client,
             config=config,
-        )
-
-        # Run synchronization
-        result = await sync_service.sync_points_for_site(
-            site, dry_run=dry_run, limit=limit, sync_all=sync_all
-        )
+            ace_async_client=ace_async_client,
+        ) as sync_service:
+            # Run synchronization
+            result = await sync_service.sync_points_for_site(
+                site, dry_run=dry_run, limit=limit, sync_all=sync_all
+            )
 
         # Log results
         logger.info("sync_complete", result=result.to_dict())
@@ -518,16 +531,16 @@ async def _run_sync_refs_from_skyspark(
         raise RuntimeError("Logger not initialized")
 
     # Create clients with proper session management
-    async with create_clients(config) as (ace_client, skyspark_client):
-        # Create sync service
-        sync_service = PointSyncService(
+    async with create_clients(config) as (ace_client, skyspark_client, ace_async_client):
+        # Create sync service (owns the ACE worker threads for the sync client)
+        async with PointSyncService(
             ace_client=ace_client,
             skyspark_client=skyspark_client,
             config=config,
-        )
-
-        # Run reverse sync
-        result = await sync_service.sync_refs_from_skyspark(site=site, dry_run=dry_run)
+            ace_async_client=ace_async_client,
+        ) as sync_service:
+            # Run reverse sync
+            result = await sync_service.sync_refs_from_skyspark(site=site, dry_run=dry_run)
 
         # Log results
         logger.info("sync_refs_complete", **result)
@@ -573,23 +586,23 @@ async def _run_write_history(
         raise RuntimeError("Logger not initialized")
 
     # Create clients with proper session management
-    async with create_clients(config) as (ace_client, skyspark_client):
-        # Create sync service
-        sync_service = PointSyncService(
+    async with create_clients(config) as (ace_client, skyspark_client, ace_async_client):
+        # Create sync service (owns the ACE worker threads for the sync client)
+        async with PointSyncService(
             ace_client=ace_client,
             skyspark_client=skyspark_client,
             config=config,
-        )
-
-        # Run write history
-        result = await sync_service.write_history(
-            site=site,
-            start_time=start,
-            end_time=end,
-            limit=limit,
-            chunk_size=chunk_size,
-            dry_run=dry_run,
-        )
+            ace_async_client=ace_async_client,
+        ) as sync_service:
+            # Run write history
+            result = await sync_service.write_history(
+                site=site,
+                start_time=start,
+                end_time=end,
+                limit=limit,
+                chunk_size=chunk_size,
+                dry_run=dry_run,
+            )
 
         # Display summary
         click.echo("\nWrite History Results:")
@@ -619,7 +632,7 @@ async def _run_debug_project_tz(config: Config) -> None:
         raise RuntimeError("Logger not initialized")
 
     # Create clients with proper session management
-    async with create_clients(config) as (ace_client, skyspark_client):
+    async with create_clients(config) as (ace_client, skyspark_client, _):
         # 1. Check what the about endpoint returns via session manager
         click.echo("\n=== About Endpoint ===")
         try:
@@ -675,7 +688,7 @@ async def _run_check_timezones(
         raise RuntimeError("Logger not initialized")
 
     # Create clients with proper session management
-    async with create_clients(config) as (ace_client, skyspark_client):
+    async with create_clients(config) as (ace_client, skyspark_client, _):
         # Read all sites
         all_sites = await skyspark_client.read_sites()
         logger.info("sites_fetched", count=len(all_sites))
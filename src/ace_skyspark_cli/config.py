@@ -98,6 +98,15 @@ class AppConfig(BaseSettings):
     log_json: bool = Field(default=False, description="Use JSON logging format")
     batch_size: int = Field(default=500, description="Batch size for entity creation")
     max_concurrent: int = Field(default=5, description="Maximum concurrent operations")
+    ace_async_http: bool = Field(
+        default=True, description="Use the async HTTP client for ACE API calls"
+    )
+    ace_rate_limit: float = Field(
+        default=5.0, description="Maximum ACE API requests per second (0 disables limiting)"
+    )
+    ace_max_retries: int = Field(
+        default=3, description="Retries for rate-limited or failed async ACE API requests"
+    )
     dry_run: bool = Field(default=False, description="Dry run mode - no changes made")
 
     @field_validator("log_level")
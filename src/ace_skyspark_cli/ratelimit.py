@@ -0,0 +1,55 @@
+"""Async rate limiting for outbound API requests."""
+
+import asyncio
+import time
+from types import TracebackType
+
+
+class AsyncTokenBucket:
+    """Token-bucket rate limiter for asyncio callers.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``. Each
+    acquire consumes one token, waiting only as long as needed for the next token
+    instead of sleeping a fixed interval between requests.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        """Initialize the limiter.
+
+        Args:
+            rate: Tokens added per second (sustained requests per second)
+            capacity: Maximum burst size (defaults to max(1, rate))
+        """
+        if rate <= 0:
+            msg = "rate must be positive"
+            raise ValueError(msg)
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    async def __aenter__(self) -> "AsyncTokenBucket":
+        """Acquire a token on context entry."""
+        await self.acquire()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Nothing to release; tokens refill over time."""
@@ -5,22 +5,71 @@ from ACE FlightDeck to SkySpark using haystackRef KV tags for tracking.
 """
 
 import asyncio
+import heapq
+import logging
+import random
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from operator import itemgetter
+from types import TracebackType
 from typing import Any
 
 import structlog
 from ace_skyspark_lib import Equipment, Point, Site, SkysparkClient
 from ace_skyspark_lib.models.history import HistorySample
-from aceiot_models.api import APIClient
+from aceiot_models.api import APIClient, APIError, AsyncAPIClient
 
 from ace_skyspark_cli.config import Config
+from ace_skyspark_cli.ratelimit import AsyncTokenBucket
 
 logger = structlog.get_logger(__name__)
+# structlog renders through this stdlib logger; checked to skip per-point debug events
+_stdlib_logger = logging.getLogger(__name__)
+
+# HTTP statuses worth retrying on ACE requests (rate limited or transient server errors)
+RETRYABLE_ACE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Per-point processing failures logged with a traceback before falling back to the message only
+MAX_POINT_ERROR_TRACEBACKS = 10
+
+
+def _ref_value(ref: Any) -> str:
+    """Extract a bare ref id from a SkySpark ref value.
+
+    Args:
+        ref: Ref as a Zinc dict ({"_kind": "ref", "val": "@id"}), a string, or None
+
+    Returns:
+        Ref id without the leading "@", or "" if missing
+    """
+    # Exact type checks: decoded Zinc values are plain dicts and strs
+    if type(ref) is dict:
+        ref = ref.get("val")
+    if not ref:
+        return ""
+    val = ref if type(ref) is str else str(ref)
+    # Slice instead of lstrip so bare ids are returned without a copy
+    return val[1:] if val[:1] == "@" else val
 
 
 class SyncResult:
     """Result of a synchronization operation."""
 
+    __slots__ = (
+        "sites_created",
+        "sites_updated",
+        "sites_skipped",
+        "equipment_created",
+        "equipment_updated",
+        "equipment_skipped",
+        "points_created",
+        "points_updated",
+        "points_skipped",
+        "errors",
+    )
+
     def __init__(self) -> None:
         """Initialize sync result."""
         self.sites_created: int = 0
@@ -73,12 +122,33 @@ class PointSyncService:
     """Service for synchronizing points from ACE to SkySpark."""
 
     HAYSTACK_REF_TAG = "haystackRef"
+    HAYSTACK_SITE_REF_TAG = "haystack_siteRef"
+    HAYSTACK_EQUIP_REF_TAG = "haystack_equipRef"
+    SKYSPARK_TZ_TAG = "skysparkTz"
+    ACE_TOPIC_TAG = "ace_topic"
+    # refName prefix marking SkySpark equipment created from ACE devices
+    EQUIP_REF_NAME_PREFIX = "ace-equip-"
+    # Only SkySpark points carrying a haystackRef can match an ACE point, so reads
+    # for matching skip every other point server-side
+    SYNCED_POINT_FILTER = "point and haystackRef"
+
+    # ACE kv_tags never copied onto SkySpark points:
+    # - haystack refs are top-level Point fields (siteRef/equipRef)
+    # - tz is a top-level Point field, not a tag
+    # - skysparkTz is for ACE reference only, not for SkySpark
+    EXCLUDED_KV_TAGS = frozenset(
+        {HAYSTACK_REF_TAG, HAYSTACK_SITE_REF_TAG, HAYSTACK_EQUIP_REF_TAG, "tz", SKYSPARK_TZ_TAG}
+    )
+    # Haystack point function markers; a point carries exactly one
+    FUNCTION_MARKER_TAGS = ("sensor", "cmd", "sp", "synthetic")
+    FUNCTION_MARKERS = frozenset(FUNCTION_MARKER_TAGS)
 
     def __init__(
         self,
         ace_client: APIClient,
         skyspark_client: SkysparkClient,
         config: Config,
+        ace_async_client: AsyncAPIClient | None = None,
     ) -> None:
         """Initialize sync service.
 
@@ -86,10 +156,38 @@ class PointSyncService:
             ace_client: ACE FlightDeck API client
             skyspark_client: SkySpark client
             config: Application configuration
+            ace_async_client: Optional async ACE client; when set, ref storage awaits it
+                directly instead of running the sync client in a thread
         """
         self.ace_client = ace_client
         self.skyspark_client = skyspark_client
         self.config = config
+        self.ace_async_client = ace_async_client
+        self._ace_limiter: AsyncTokenBucket | None = None
+        self._ace_executor: ThreadPoolExecutor | None = None
+        self._write_semaphore: asyncio.Semaphore | None = None
+
+        # (device_address, device_id) -> equipment key, shared by every point on a device
+        self._equip_keys: dict[tuple[Any, Any], str] = {}
+
+    async def __aenter__(self) -> "PointSyncService":
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit async context manager, releasing the ACE worker threads."""
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the ACE worker threads, if any were started."""
+        if self._ace_executor is not None:
+            self._ace_executor.shutdown(wait=False, cancel_futures=True)
+            self._ace_executor = None
 
     async def sync_points_for_site(
         self,
@@ -101,13 +199,16 @@ class PointSyncService:
         """Synchronize all points for a specific site.
 
         This method:
-        1. Fetches points from ACE FlightDeck for the given site
+        1. Fetches points from ACE FlightDeck for the given site, concurrently with
+           the SkySpark entity read and site sync
            - Uses /sites/{site}/configured_points by default (collect_enabled=True)
            - Uses /sites/{site}/points when sync_all=True
         2. Sorts points by name for deterministic ordering
         3. Applies limit if specified
         4. Checks for existing SkySpark entities using haystackRef tags
-        5. Creates new entities or updates existing ones
+        5. Creates new entities or updates existing ones, skipping points whose
+           SkySpark tags already hold what the update would write (ACE refs are
+           still stored again for skipped points when they are out of date)
         6. Maintains idempotency by storing SkySpark IDs back to ACE
 
         Args:
@@ -122,9 +223,19 @@ class PointSyncService:
         result = SyncResult()
         logger.info("sync_start", site=site_name, dry_run=dry_run, limit=limit, sync_all=sync_all)
 
+        # The ACE point fetch doesn't depend on SkySpark, so overlap it with the site sync
+        ace_points_task = asyncio.create_task(
+            self._collect_ace_points(site_name, configured_only=not sync_all, limit=limit)
+        )
+
         try:
+            # Read existing sites, equipment and points in one round trip
+            entities = await self._read_skyspark_entities()
+
             # Step 1: Sync site entity first and get site's timezone
-            site_ref, site_created, site_tz = await self._sync_site(site_name, dry_run)
+            site_ref, site_created, site_tz = await self._sync_site(
+                site_name, dry_run, existing_sites=entities["site"] if entities else None
+            )
             if not site_ref:
                 logger.error("site_sync_failed", site=site_name)
                 result.add_error(f"Failed to sync site: {site_name}")
@@ -137,8 +248,8 @@ class PointSyncService:
             else:
                 result.sites_skipped += 1
 
-            # Fetch points from ACE (configured/collected only unless sync_all=True)
-            ace_points = await self._fetch_ace_points(site_name, configured_only=not sync_all)
+            # Points from ACE (configured/collected only unless sync_all=True)
+            ace_points, total_points = await ace_points_task
 
             if not ace_points:
                 if sync_all:
@@ -147,13 +258,8 @@ class PointSyncService:
                     logger.warning("no_configured_points_found", site=site_name)
                 return result
 
-            # Sort points by name for deterministic ordering
-            ace_points = sorted(ace_points, key=lambda p: p["name"])
-            total_points = len(ace_points)
-
-            # Apply limit if specified
+            # Report the limit if specified
             if limit is not None and limit > 0:
-                ace_points = ace_points[:limit]
                 logger.info(
                     "points_limited",
                     total=total_points,
@@ -168,13 +274,28 @@ class PointSyncService:
                 equip_created_count,
                 equip_updated_count,
                 equip_skipped_count,
-            ) = await self._sync_equipment(site_name, site_ref, ace_points, dry_run, site_tz)
+            ) = await self._sync_equipment(
+                site_name,
+                site_ref,
+                ace_points,
+                dry_run,
+                site_tz,
+                existing_equipment=entities["equip"] if entities else None,
+            )
             result.equipment_created += equip_created_count
             result.equipment_updated += equip_updated_count
             result.equipment_skipped += equip_skipped_count
 
-            # Fetch existing SkySpark points to check for matches
-            skyspark_points = await self._fetch_skyspark_points()
+            # Existing SkySpark points to check for matches
+            # (site/equip creation above never adds points, so the prefetch is still current)
+            if entities:
+                skyspark_points = entities["point"]
+            elif any(map(self._get_haystack_ref, ace_points)):
+                skyspark_points = await self._fetch_skyspark_points(self.SYNCED_POINT_FILTER)
+            else:
+                # No ACE point carries a haystackRef yet, so every point is a create
+                logger.info("skyspark_points_fetch_skipped", reason="no_haystack_refs")
+                skyspark_points = []
             logger.info("skyspark_points_fetched", count=len(skyspark_points))
 
             # Build lookup map: haystackRef -> SkySpark point
@@ -185,30 +306,46 @@ class PointSyncService:
             points_to_update: list[Point] = []
             ace_points_to_create: list[dict[str, Any]] = []  # Track original ACE dicts for creates
             ace_points_to_update: list[dict[str, Any]] = []  # Track original ACE dicts for updates
+            ace_points_to_refresh: list[dict[str, Any]] = []  # Unchanged points, stale ACE refs
+            sky_points_to_refresh: list[dict[str, Any]] = []
+            point_errors = 0
+            debug = _stdlib_logger.isEnabledFor(logging.DEBUG)
+            haystack_ref_tag = self.HAYSTACK_REF_TAG
 
             for ace_point in ace_points:
                 try:
                     # Check if point already exists in SkySpark
-                    haystack_ref = self._get_haystack_ref(ace_point)
-                    logger.debug(
-                        "checking_point",
-                        point=ace_point.get("name"),
-                        haystack_ref=haystack_ref,
-                        ref_type=type(haystack_ref).__name__,
-                    )
+                    kv_tags = ace_point.get("kv_tags")
+                    haystack_ref = kv_tags.get(haystack_ref_tag) if kv_tags else None
+                    if debug:
+                        logger.debug(
+                            "checking_point",
+                            point=ace_point.get("name"),
+                            haystack_ref=haystack_ref,
+                        )
 
                     if haystack_ref and haystack_ref in skyspark_ref_map:
                         # Point exists - prepare update (will fix refs if needed)
                         sky_point = skyspark_ref_map[haystack_ref]
-                        logger.debug("point_exists_updating", point=ace_point.get("name"))
+                        if debug:
+                            logger.debug("point_exists_updating", point=ace_point.get("name"))
                         updated_point = self._prepare_point_update(
                             ace_point, sky_point, site_ref, equipment_ref_map, site_tz
                         )
+                        if self._point_matches_skyspark(updated_point, sky_point):
+                            # SkySpark already holds what an update would write
+                            result.points_skipped += 1
+                            if not self._ace_refs_current(ace_point, sky_point, site_tz):
+                                # ACE copy of the refs is stale, so store them again
+                                ace_points_to_refresh.append(ace_point)
+                                sky_points_to_refresh.append(sky_point)
+                            continue
                         points_to_update.append(updated_point)
                         ace_points_to_update.append(ace_point)  # Keep original ACE dict
                     else:
                         # Point doesn't exist - prepare create
-                        logger.debug("point_new_creating", point=ace_point.get("name"))
+                        if debug:
+                            logger.debug("point_new_creating", point=ace_point.get("name"))
                         new_point = self._prepare_point_create(
                             ace_point, site_ref, equipment_ref_map, site_tz
                         )
@@ -216,140 +353,249 @@ class PointSyncService:
                         ace_points_to_create.append(ace_point)  # Keep original ACE dict
 
                 except Exception as e:
-                    import traceback
-
                     error_msg = f"Error processing point {ace_point.get('name', 'unknown')}: {e!s}"
+                    point_errors += 1
                     logger.error(
-                        "point_processing_error", error=str(e), traceback=traceback.format_exc()
+                        "point_processing_error",
+                        error=str(e),
+                        exc_info=point_errors <= MAX_POINT_ERROR_TRACEBACKS,
                     )
                     result.add_error(error_msg)
                     continue
 
             # Execute creates and updates with batched ref storage for resilience
+            # Creates and updates touch disjoint entities, so run them concurrently
             if not dry_run:
-                if points_to_create:
-                    created, failed = await self._create_points_batch_resilient(
+                (
+                    (created, create_failed),
+                    (updated, update_failed),
+                    (_, refresh_failed),
+                ) = await asyncio.gather(
+                    self._create_points_batch_resilient(
                         points_to_create, ace_points_to_create, site_tz
-                    )
-                    result.points_created += created
-                    if failed > 0:
-                        result.add_error(f"Failed to create {failed} points (see logs for details)")
-
-                if points_to_update:
-                    updated, failed = await self._update_points_batch_resilient(
+                    ),
+                    self._update_points_batch_resilient(
                         points_to_update, ace_points_to_update, site_tz
+                    ),
+                    self._store_refs_batched(ace_points_to_refresh, sky_points_to_refresh, site_tz),
+                )
+                result.points_created += created
+                if create_failed > 0:
+                    result.add_error(
+                        f"Failed to create {create_failed} points (see logs for details)"
+                    )
+                result.points_updated += updated
+                if update_failed > 0:
+                    result.add_error(
+                        f"Failed to update {update_failed} points (see logs for details)"
+                    )
+                if refresh_failed > 0:
+                    result.add_error(
+                        f"Failed to store refs for {refresh_failed} unchanged points "
+                        "(see logs for details)"
                     )
-                    result.points_updated += updated
-                    if failed > 0:
-                        result.add_error(f"Failed to update {failed} points (see logs for details)")
             else:
                 logger.info(
                     "dry_run_summary",
                     would_create=len(points_to_create),
                     would_update=len(points_to_update),
+                    would_refresh_refs=len(ace_points_to_refresh),
                 )
 
         except Exception as e:
             error_msg = f"Sync failed for site {site_name}: {e!s}"
             result.add_error(error_msg)
+        finally:
+            # No-op once awaited; stops the fetch if the site sync bailed out first
+            ace_points_task.cancel()
 
         logger.info("sync_complete", site=site_name, result=result.to_dict())
         return result
 
-    async def _fetch_ace_points(
+    async def _collect_ace_points(
+        self, site_name: str, configured_only: bool, limit: int | None
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Fetch ACE points for a site sorted by name, truncated to ``limit``.
+
+        Points repeated across pages (FlightDeck pagination can overlap) are kept
+        once, by first occurrence, so they are never matched or written twice.
+
+        Args:
+            site_name: Site name to filter by
+            configured_only: If True, fetch only configured/collected points
+            limit: Maximum number of points to keep (None or <= 0 keeps all)
+
+        Returns:
+            Tuple of (points sorted by name, distinct points fetched before the limit)
+        """
+        by_name = itemgetter("name")
+        # 0 keeps every point
+        keep = limit if limit is not None and limit > 0 else 0
+        seen: set[str] = set()
+        duplicates = 0
+        ace_points: list[dict[str, Any]] = []
+        async for items in self._iter_ace_point_pages(site_name, configured_only):
+            new_items = []
+            for point in items:
+                name = point["name"]
+                if name in seen:
+                    duplicates += 1
+                else:
+                    seen.add(name)
+                    new_items.append(point)
+            if keep:
+                # Keep only the first `limit` names as pages arrive instead of holding them all
+                ace_points = heapq.nsmallest(keep, ace_points + new_items, key=by_name)
+            else:
+                ace_points.extend(new_items)
+
+        if duplicates:
+            logger.warning("duplicate_ace_points_dropped", site=site_name, count=duplicates)
+        if not keep:
+            ace_points.sort(key=by_name)
+        logger.info("ace_points_fetched", site=site_name, count=len(seen))
+        return ace_points, len(seen)
+
+    async def _iter_ace_point_pages(
         self, site_name: str, configured_only: bool = True
-    ) -> list[dict[str, Any]]:
-        """Fetch all points from ACE FlightDeck with pagination.
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield pages of ACE points in page order as they become available.
+
+        The first page is fetched alone to learn the page count; the remaining pages
+        are fetched concurrently (bounded by ``app.max_concurrent``). Pages that fail
+        are logged and skipped.
 
         Args:
             site_name: Site name to filter by
             configured_only: If True, fetch only configured/collected points (default: True)
 
-        Returns:
-            List of all ACE point dictionaries (paginated)
+        Yields:
+            The point dictionaries of each successfully fetched page
         """
         logger.info("fetching_ace_points", site=site_name, configured_only=configured_only)
 
-        # ACE API client is synchronous, run in thread pool
-        loop = asyncio.get_event_loop()
-
-        # Choose API method based on configured_only flag
         per_page = 500  # FlightDeck API page size (underlying issues fixed)
 
-        all_points: list[dict[str, Any]] = []
-        page = 1
-        total_pages_expected = None
-
         # Choose the appropriate endpoint
-        if configured_only:
-            api_method = self.ace_client.get_site_configured_points
-        else:
-            api_method = self.ace_client.get_site_points
+        api_method = "get_site_configured_points" if configured_only else "get_site_points"
+
+        # Bound in-flight page requests to avoid rate limiting
+        semaphore = asyncio.Semaphore(self.config.app.max_concurrent)
+
+        async def fetch_page(page: int) -> dict[str, Any]:
+            async with semaphore:
+                return await self._call_ace(api_method, site_name, page, per_page)
+
+        def log_page_failure(page: int, fetched: int, total_pages: int | None) -> None:
+            # Note: FlightDeck API has data corruption issues that cause 500 errors
+            # when fetching certain pages. This is a known server-side issue.
+            logger.warning(
+                "pagination_failed_continuing_with_partial_data",
+                page=page,
+                total_fetched=fetched,
+                expected_total=total_pages * per_page if total_pages else "unknown",
+                message="FlightDeck API returned 500 error - likely data corruption on this page",
+            )
 
-        while True:
-            try:
-                # Fetch current page
-                response = await loop.run_in_executor(
-                    None,
-                    api_method,
-                    site_name,
-                    page,
-                    per_page,
-                )
+        # First page tells us how many pages to expect
+        try:
+            first_response = await fetch_page(1)
+        except Exception:
+            log_page_failure(1, 0, None)
+            return
 
-                # Extract items
-                items = response.get("items", [])
-                if not items:
-                    break
+        first_items = first_response.get("items", [])
+        total_pages_expected = first_response.get("pages", 1)
+        fetched = len(first_items)
+        yield first_items
 
-                all_points.extend(items)
+        if not first_items or total_pages_expected <= 1:
+            return
 
-                # Track expected total pages
-                if total_pages_expected is None:
-                    total_pages_expected = response.get("pages", 1)
+        logger.debug(
+            "fetching_remaining_pages",
+            total_pages=total_pages_expected,
+            max_concurrent=self.config.app.max_concurrent,
+        )
+        pending = deque(
+            (page, asyncio.create_task(fetch_page(page)))
+            for page in range(2, total_pages_expected + 1)
+        )
+        try:
+            # Hand pages over in order, releasing each one once the consumer has it
+            while pending:
+                page, task = pending.popleft()
+                try:
+                    response = await task
+                except Exception:
+                    log_page_failure(page, fetched, total_pages_expected)
+                    continue
+                items = response.get("items", [])
+                fetched += len(items)
+                yield items
+        finally:
+            # Consumer stopped early or failed: don't leave page requests running
+            for _, task in pending:
+                task.cancel()
 
-                # Check if we've reached the last page
-                if page >= total_pages_expected:
-                    break
+    async def _read_skyspark_entities(self) -> dict[str, list[dict[str, Any]]] | None:
+        """Read SkySpark sites, equipment and ACE-synced points with a single filter.
 
-                page += 1
-                logger.debug("fetching_page", page=page, total_pages=total_pages_expected)
+        Replaces separate read_sites/read_equipment/read_points round trips. Points
+        are limited to ``SYNCED_POINT_FILTER`` since only those can match. Entities
+        are partitioned client-side by their site/equip/point marker.
 
-                # Add delay between pages to avoid rate limiting
-                await asyncio.sleep(1.0)
+        Returns:
+            Dict with "site", "equip" and "point" entity lists, or None if the read
+            failed (callers then fall back to their individual reads)
+        """
+        try:
+            entities = await self.skyspark_client.read(
+                f"site or equip or ({self.SYNCED_POINT_FILTER})"
+            )
+        except Exception as e:
+            logger.warning("skyspark_bulk_read_failed", error=str(e))
+            return None
 
-            except Exception:
-                # Log warning and return what we have so far
-                # Note: FlightDeck API has data corruption issues that cause 500 errors
-                # when fetching certain pages. This is a known server-side issue.
-                logger.warning(
-                    "pagination_failed_continuing_with_partial_data",
-                    page=page,
-                    total_fetched=len(all_points),
-                    expected_total=total_pages_expected * per_page
-                    if total_pages_expected
-                    else "unknown",
-                    message="FlightDeck API returned 500 error - likely data corruption on this page",
-                )
-                break
+        partitioned: dict[str, list[dict[str, Any]]] = {"site": [], "equip": [], "point": []}
+        for entity in entities:
+            for marker, bucket in partitioned.items():
+                if marker in entity:
+                    bucket.append(entity)
 
-        logger.info("ace_points_fetched", site=site_name, count=len(all_points))
-        return all_points
+        logger.info(
+            "skyspark_entities_fetched",
+            sites=len(partitioned["site"]),
+            equipment=len(partitioned["equip"]),
+            points=len(partitioned["point"]),
+        )
+        return partitioned
 
-    async def _fetch_skyspark_points(self) -> list[dict[str, Any]]:
-        """Fetch all points from SkySpark.
+    async def _fetch_skyspark_points(self, filter_expr: str | None = None) -> list[dict[str, Any]]:
+        """Fetch points from SkySpark.
+
+        Args:
+            filter_expr: Optional Haystack filter narrowing the read server-side
+                (e.g. "point and ace_topic"); all points are read if None
 
         Returns:
             List of SkySpark point dictionaries
         """
-        logger.info("fetching_skyspark_points")
+        logger.info("fetching_skyspark_points", filter=filter_expr)
         try:
+            if filter_expr:
+                return await self.skyspark_client.read(filter_expr)
             return await self.skyspark_client.read_points()
         except Exception as e:
             logger.error("skyspark_fetch_failed", error=str(e))
             return []
 
-    async def _sync_site(self, site_name: str, dry_run: bool) -> tuple[str | None, bool, str]:
+    async def _sync_site(
+        self,
+        site_name: str,
+        dry_run: bool,
+        existing_sites: list[dict[str, Any]] | None = None,
+    ) -> tuple[str | None, bool, str]:
         """Synchronize site entity to SkySpark.
 
         SkySpark site is the source of truth for timezone.
@@ -359,6 +605,7 @@ class PointSyncService:
         Args:
             site_name: ACE site name
             dry_run: If True, don't make any changes
+            existing_sites: Prefetched SkySpark sites; read from SkySpark if None
 
         Returns:
             Tuple of (SkySpark site reference ID, was_created, site_timezone)
@@ -370,10 +617,11 @@ class PointSyncService:
         # SkySpark is source of truth for timezone
         ref_name = f"ace-site-{site_name}"
         try:
-            existing_sites = await self.skyspark_client.read_sites()
+            if existing_sites is None:
+                existing_sites = await self.skyspark_client.read_sites()
             for sky_site in existing_sites:
                 if sky_site.get("refName") == ref_name:
-                    site_id = sky_site.get("id", {}).get("val", "").lstrip("@")
+                    site_id = _ref_value(sky_site.get("id"))
                     sky_tz = sky_site.get("tz", "UTC")
                     logger.info(
                         "site_already_exists_in_skyspark",
@@ -389,9 +637,8 @@ class PointSyncService:
 
         # Site doesn't exist in SkySpark - need to create it
         # Fetch site data from ACE to get attributes for creation
-        loop = asyncio.get_event_loop()
         try:
-            ace_site = await loop.run_in_executor(None, self.ace_client.get_site, site_name)
+            ace_site = await self._call_ace("get_site", site_name)
         except Exception as e:
             logger.error("fetch_ace_site_failed", site=site_name, error=str(e))
             return (None, False, "UTC")
@@ -430,7 +677,7 @@ class PointSyncService:
                 logger.error("site_creation_failed", site=site_name)
                 return (None, False, "UTC")
 
-            site_id = created_sites[0].get("id", {}).get("val", "").lstrip("@")
+            site_id = _ref_value(created_sites[0].get("id"))
             # Read actual timezone from created site (SkySpark is source of truth)
             created_site_tz = created_sites[0].get("tz", "UTC")
             logger.info(
@@ -457,6 +704,7 @@ class PointSyncService:
         ace_points: list[dict[str, Any]],
         dry_run: bool,
         site_tz: str,
+        existing_equipment: list[dict[str, Any]] | None = None,
     ) -> tuple[dict[str, str], int, int, int]:
         """Synchronize equipment entities to SkySpark.
 
@@ -468,6 +716,7 @@ class PointSyncService:
             ace_points: List of ACE points
             dry_run: If True, don't make any changes
             site_tz: Site's timezone
+            existing_equipment: Prefetched SkySpark equipment; read from SkySpark if None
 
         Returns:
             Tuple of (equipment_ref_map, created_count, updated_count, skipped_count)
@@ -480,6 +729,9 @@ class PointSyncService:
 
         # Extract unique equipment from points
         equipment_map: dict[str, dict[str, Any]] = {}
+        # Many points share a device; dedupe on the raw pair before formatting the key
+        seen_devices: set[tuple[Any, Any]] = set()
+        seen_add = seen_devices.add
 
         for point in ace_points:
             bacnet_data = point.get("bacnet_data")
@@ -487,20 +739,28 @@ class PointSyncService:
                 continue
 
             # Use device_address-device_id as unique identifier
-            device_addr = bacnet_data.get("device_address")
-            device_id = bacnet_data.get("device_id")
+            bacnet_get = bacnet_data.get
+            device_addr = bacnet_get("device_address")
+            device_id = bacnet_get("device_id")
             if not device_addr or device_id is None:
                 continue
 
-            equip_key = f"{device_addr}-{device_id}"
-            if equip_key not in equipment_map:
-                equipment_map[equip_key] = {
+            device = (device_addr, device_id)
+            if device in seen_devices:
+                continue
+            seen_add(device)
+
+            equip_key = self._equip_key(device_addr, device_id)
+            equipment_map.setdefault(
+                equip_key,
+                {
                     "key": equip_key,
                     "device_address": device_addr,
                     "device_id": device_id,
-                    "device_name": bacnet_data.get("device_name") or equip_key,
-                    "device_description": bacnet_data.get("device_description"),
-                }
+                    "device_name": bacnet_get("device_name") or equip_key,
+                    "device_description": bacnet_get("device_description"),
+                },
+            )
 
         logger.info("equipment_extracted", count=len(equipment_map))
 
@@ -514,15 +774,12 @@ class PointSyncService:
 
         # Check for existing equipment in SkySpark by refName
         try:
-            existing_equipment = await self.skyspark_client.read_equipment()
-            existing_equip_map: dict[str, str] = {}
-            for equip in existing_equipment:
-                ref_name = equip.get("refName", "")
-                # Extract equipment key from refName: "ace-equip-{key}"
-                if ref_name.startswith("ace-equip-"):
-                    equip_key = ref_name[10:]  # Remove "ace-equip-" prefix
-                    equip_id = equip.get("id", {}).get("val", "").lstrip("@")
-                    existing_equip_map[equip_key] = equip_id
+            if existing_equipment is None:
+                existing_equip_map = self._build_equip_map(
+                    await self.skyspark_client.read_equipment()
+                )
+            else:
+                existing_equip_map = self._build_equip_map(existing_equipment)
 
             logger.info("existing_equipment_found", count=len(existing_equip_map))
         except Exception as e:
@@ -535,27 +792,19 @@ class PointSyncService:
         equip_keys_to_create: list[str] = []
         equip_keys_to_update: list[str] = []
         equip_ref_map: dict[str, str] = {}
-
-        # Also need to check existing equipment's siteRef - may need updating if orphaned
-        existing_equipment_full = {equip.get("refName", ""): equip for equip in existing_equipment}
+        debug = _stdlib_logger.isEnabledFor(logging.DEBUG)
 
         for equip_info in equipment_map.values():
             equip_key = equip_info["key"]
-            ref_name = f"ace-equip-{equip_key}"
+            ref_name = f"{self.EQUIP_REF_NAME_PREFIX}{equip_key}"
 
             # Check if equipment already exists
-            if equip_key in existing_equip_map:
-                equip_id = existing_equip_map[equip_key]
+            existing = existing_equip_map.get(equip_key)
+            if existing is not None:
+                equip_id, existing_site_ref_val, existing_equip = existing
                 equip_ref_map[equip_key] = equip_id
 
                 # Check if siteRef needs updating (orphaned or wrong site)
-                existing_equip = existing_equipment_full.get(ref_name, {})
-                existing_site_ref = existing_equip.get("siteRef", {})
-                if isinstance(existing_site_ref, dict):
-                    existing_site_ref_val = existing_site_ref.get("val", "").lstrip("@")
-                else:
-                    existing_site_ref_val = str(existing_site_ref).lstrip("@")
-
                 if existing_site_ref_val != site_ref:
                     # Need to update this equipment's siteRef
                     logger.info(
@@ -598,7 +847,7 @@ class PointSyncService:
                     )
                     equipment_to_update.append(equipment_entity)
                     equip_keys_to_update.append(equip_key)
-                else:
+                elif debug:
                     logger.debug("equipment_already_exists", key=equip_key, ref=equip_id)
             else:
                 # Need to create this equipment
@@ -637,7 +886,7 @@ class PointSyncService:
 
                 # Add created equipment to the ref map
                 for i, equip in enumerate(created_equipment):
-                    equip_id = equip.get("id", {}).get("val", "").lstrip("@")
+                    equip_id = _ref_value(equip.get("id"))
                     equip_key = equip_keys_to_create[i]
                     equip_ref_map[equip_key] = equip_id
 
@@ -678,6 +927,47 @@ class PointSyncService:
             message="ACE API does not support kv_tags on sites yet",
         )
 
+    def _equip_key(self, device_addr: Any, device_id: Any) -> str:
+        """Return the equipment key ("{device_address}-{device_id}") for a BACnet device.
+
+        Args:
+            device_addr: BACnet device address
+            device_id: BACnet device instance id
+
+        Returns:
+            Equipment key, formatted once per device and reused for its other points
+        """
+        device = (device_addr, device_id)
+        equip_key = self._equip_keys.get(device)
+        if equip_key is None:
+            equip_key = self._equip_keys[device] = f"{device_addr}-{device_id}"
+        return equip_key
+
+    def _build_equip_map(
+        self, existing_equipment: list[dict[str, Any]]
+    ) -> dict[str, tuple[str, str, dict[str, Any]]]:
+        """Build a map of equipment key -> existing SkySpark equipment created from ACE.
+
+        Args:
+            existing_equipment: List of SkySpark equipment entities
+
+        Returns:
+            Dictionary mapping equipment key to (id, siteRef value, full entity)
+        """
+        equip_map: dict[str, tuple[str, str, dict[str, Any]]] = {}
+        prefix = self.EQUIP_REF_NAME_PREFIX
+        for equip in existing_equipment:
+            ref_name = equip.get("refName", "")
+            # Extract equipment key from refName: "ace-equip-{key}"
+            equip_key = ref_name.removeprefix(prefix)
+            if len(equip_key) != len(ref_name):
+                equip_map[equip_key] = (
+                    _ref_value(equip.get("id")),
+                    _ref_value(equip.get("siteRef")),
+                    equip,
+                )
+        return equip_map
+
     def _build_ref_map(self, skyspark_points: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
         """Build a map of haystackRef -> SkySpark point for points synced from ACE.
 
@@ -690,20 +980,15 @@ class PointSyncService:
         Returns:
             Dictionary mapping haystackRef value to point data
         """
-        ref_map: dict[str, dict[str, Any]] = {}
-
-        for point in skyspark_points:
-            # Only include points that have haystackRef (synced from ACE)
-            haystack_ref = point.get("haystackRef")
-            if not haystack_ref:
-                continue
-
-            # Extract the ref value if it's in Zinc format
-            if isinstance(haystack_ref, dict):
-                haystack_ref = haystack_ref.get("val", "")
-
-            if haystack_ref:
-                ref_map[haystack_ref] = point
+        ref_tag = self.HAYSTACK_REF_TAG
+        # Only include points that have haystackRef (synced from ACE); a Zinc-format
+        # value carries the ref under "val"
+        ref_map: dict[str, dict[str, Any]] = {
+            ref: point
+            for point in skyspark_points
+            if (ref := point.get(ref_tag))
+            and (ref := ref.get("val", "") if type(ref) is dict else ref)
+        }
 
         logger.debug("ref_map_built", count=len(ref_map))
         return ref_map
@@ -722,6 +1007,25 @@ class PointSyncService:
             return None
         return kv_tags.get(self.HAYSTACK_REF_TAG)
 
+    def _point_kv_tags(self, point_name: str, kv_tags: dict[str, Any]) -> dict[str, Any]:
+        """Build SkySpark point kv tags from an ACE point's kv_tags.
+
+        Adds ace_topic to track the original ACE point name (an ace_topic already in
+        kv_tags wins) and drops EXCLUDED_KV_TAGS.
+
+        Args:
+            point_name: ACE point name
+            kv_tags: ACE point kv_tags
+
+        Returns:
+            New kv tag dictionary for the SkySpark point
+        """
+        final_kv_tags = {self.ACE_TOPIC_TAG: point_name}
+        final_kv_tags.update(kv_tags)
+        for tag in self.EXCLUDED_KV_TAGS:
+            final_kv_tags.pop(tag, None)
+        return final_kv_tags
+
     def _prepare_point_create(
         self,
         ace_point: dict[str, Any],
@@ -751,26 +1055,7 @@ class PointSyncService:
         point_name = ace_point["name"]
         ref_name = f"ace-point-{point_id}" if point_id else f"ace-{point_name.replace(' ', '_')}"
 
-        # Add ace_topic to track original ACE point name
-        # Filter out haystack_* refs and timezone tags from kv_tags
-        # - haystack refs are top-level Point fields (siteRef/equipRef)
-        # - tz is a top-level Point field, not a tag
-        # - skysparkTz is for ACE reference only, not for SkySpark
-        final_kv_tags = {
-            "ace_topic": point_name,  # Store original ACE point name
-            **{
-                k: v
-                for k, v in kv_tags.items()
-                if k
-                not in {
-                    self.HAYSTACK_REF_TAG,
-                    "haystack_siteRef",
-                    "haystack_equipRef",
-                    "tz",
-                    "skysparkTz",
-                }
-            },
-        }
+        final_kv_tags = self._point_kv_tags(point_name, kv_tags)
 
         # Get equipment ref and display name from bacnet_data
         equip_ref = "placeholder-equip"
@@ -780,8 +1065,9 @@ class PointSyncService:
             device_addr = bacnet_data.get("device_address")
             device_id = bacnet_data.get("device_id")
             if device_addr and device_id is not None:
-                equip_key = f"{device_addr}-{device_id}"
-                equip_ref = equipment_ref_map.get(equip_key, "placeholder-equip")
+                equip_ref = equipment_ref_map.get(
+                    self._equip_key(device_addr, device_id), "placeholder-equip"
+                )
 
             # Use object_name for display if available and not empty
             object_name = bacnet_data.get("object_name")
@@ -789,16 +1075,16 @@ class PointSyncService:
                 display_name = object_name
 
         # Build marker tags: ensure exactly one function marker
-        function_markers = {"sensor", "cmd", "sp", "synthetic"}
+        function_markers = self.FUNCTION_MARKERS
         ace_function_markers = [m for m in marker_tags if m in function_markers]
         ace_other_markers = [m for m in marker_tags if m not in function_markers]
 
         if ace_function_markers:
             # ACE has function marker(s), use only the first one
-            final_marker_tags = ["point", ace_function_markers[0]] + ace_other_markers
+            final_marker_tags = ["point", ace_function_markers[0], *ace_other_markers]
         else:
             # No function marker in ACE tags, add default "sensor"
-            final_marker_tags = ["point", "sensor"] + ace_other_markers
+            final_marker_tags = ["point", "sensor", *ace_other_markers]
 
         return Point(
             dis=display_name,
@@ -833,29 +1119,13 @@ class PointSyncService:
             Updated SkySpark Point model
         """
         # Get the SkySpark ID and required fields from existing point
-        # Extract point ID (handle both dict and string formats)
-        point_id_val = sky_point.get("id", {})
-        if isinstance(point_id_val, dict):
-            point_id = point_id_val.get("val", "").lstrip("@")
-        else:
-            point_id = str(point_id_val).lstrip("@")
+        point_id = _ref_value(sky_point.get("id"))
 
         # Get existing values for required fields
         existing_ref_name = sky_point.get("refName", "")
 
-        # Extract siteRef (handle both dict and string formats)
-        site_ref_val = sky_point.get("siteRef", {})
-        if isinstance(site_ref_val, dict):
-            existing_site_ref = site_ref_val.get("val", "").lstrip("@")
-        else:
-            existing_site_ref = str(site_ref_val).lstrip("@")
-
-        # Extract equipRef (handle both dict and string formats)
-        equip_ref_val = sky_point.get("equipRef", {})
-        if isinstance(equip_ref_val, dict):
-            existing_equip_ref = equip_ref_val.get("val", "").lstrip("@")
-        else:
-            existing_equip_ref = str(equip_ref_val).lstrip("@")
+        existing_site_ref = _ref_value(sky_point.get("siteRef"))
+        existing_equip_ref = _ref_value(sky_point.get("equipRef"))
 
         existing_kind = sky_point.get("kind", "Number")
 
@@ -868,59 +1138,59 @@ class PointSyncService:
             device_addr = bacnet_data.get("device_address")
             device_id = bacnet_data.get("device_id")
             if device_addr and device_id is not None:
-                equip_key = f"{device_addr}-{device_id}"
-                equip_ref = equipment_ref_map.get(equip_key, existing_equip_ref)
+                equip_ref = equipment_ref_map.get(
+                    self._equip_key(device_addr, device_id), existing_equip_ref
+                )
 
             # Use object_name for display if available and not empty
             object_name = bacnet_data.get("object_name")
             if object_name and object_name.strip():
                 display_name = object_name
 
-        # Log if refs are being updated
+        # Log if refs are being updated (one event covering both refs)
+        ref_changes: dict[str, str] = {}
         if existing_site_ref != site_ref:
-            logger.info(
-                "point_siteref_updating",
-                point=ace_point["name"],
-                old_site=existing_site_ref,
-                new_site=site_ref,
-            )
+            ref_changes["old_site"] = existing_site_ref
+            ref_changes["new_site"] = site_ref
         if existing_equip_ref != equip_ref:
-            logger.info(
-                "point_equipref_updating",
-                point=ace_point["name"],
-                old_equip=existing_equip_ref,
-                new_equip=equip_ref,
-            )
+            ref_changes["old_equip"] = existing_equip_ref
+            ref_changes["new_equip"] = equip_ref
+        if ref_changes:
+            logger.info("point_refs_updating", point=point_name, **ref_changes)
 
         # Extract existing marker tags from SkySpark point (especially function markers)
         existing_markers = []
-        function_markers = {"sensor", "cmd", "sp", "synthetic"}
 
         # Log relevant fields from sky_point to understand format
-        logger.debug(
-            "sky_point_markers",
-            point=ace_point.get("name"),
-            sensor=sky_point.get("sensor"),
-            cmd=sky_point.get("cmd"),
-            sp=sky_point.get("sp"),
-            synthetic=sky_point.get("synthetic"),
-        )
+        debug = _stdlib_logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                "sky_point_markers",
+                point=point_name,
+                sensor=sky_point.get("sensor"),
+                cmd=sky_point.get("cmd"),
+                sp=sky_point.get("sp"),
+                synthetic=sky_point.get("synthetic"),
+            )
 
-        for key, val in sky_point.items():
+        # Probe the few function marker keys directly rather than scanning every tag
+        for key in self.FUNCTION_MARKER_TAGS:
+            val = sky_point.get(key)
             # Marker tags in SkySpark are stored as "m:" or True or with _kind: "marker"
-            if key in function_markers and (
+            if val is not None and (
                 val == "m:"
                 or val is True
                 or (isinstance(val, dict) and val.get("_kind") == "marker")
             ):
                 existing_markers.append(key)
 
-        logger.debug(
-            "extracted_markers",
-            point=ace_point.get("name"),
-            existing_markers=existing_markers,
-            has_function_marker=len(existing_markers) > 0,
-        )
+        if debug:
+            logger.debug(
+                "extracted_markers",
+                point=point_name,
+                existing_markers=existing_markers,
+                has_function_marker=len(existing_markers) > 0,
+            )
 
         # Merge tags from ACE into SkySpark point
         marker_tags = ace_point.get("marker_tags") or []
@@ -928,40 +1198,22 @@ class PointSyncService:
 
         # Combine markers intelligently: ensure exactly one function marker
         # ACE marker_tags take precedence over existing SkySpark markers
-        function_markers = {"sensor", "cmd", "sp", "synthetic"}
+        function_markers = self.FUNCTION_MARKERS
         ace_function_markers = [m for m in marker_tags if m in function_markers]
         ace_other_markers = [m for m in marker_tags if m not in function_markers]
 
         if ace_function_markers:
             # ACE has function marker(s), use only the first one
-            final_marker_tags = ["point", ace_function_markers[0]] + ace_other_markers
+            final_marker_tags = ["point", ace_function_markers[0], *ace_other_markers]
         elif existing_markers:
             # ACE has no function markers, preserve SkySpark's (should be only one)
-            final_marker_tags = ["point", existing_markers[0]] + ace_other_markers
+            final_marker_tags = ["point", existing_markers[0], *ace_other_markers]
         else:
             # No function markers anywhere, add default "sensor"
-            final_marker_tags = ["point", "sensor"] + ace_other_markers
+            final_marker_tags = ["point", "sensor", *ace_other_markers]
 
         # Build kv_tags including mod field for optimistic locking
-        # Filter out haystack_* refs and timezone tags from kv_tags
-        # - haystack refs are top-level Point fields (siteRef/equipRef)
-        # - tz is a top-level Point field, not a tag
-        # - skysparkTz is for ACE reference only, not for SkySpark
-        final_kv_tags = {
-            "ace_topic": point_name,  # Store original ACE point name
-            **{
-                k: v
-                for k, v in kv_tags.items()
-                if k
-                not in {
-                    self.HAYSTACK_REF_TAG,
-                    "haystack_siteRef",
-                    "haystack_equipRef",
-                    "tz",
-                    "skysparkTz",
-                }
-            },
-        }
+        final_kv_tags = self._point_kv_tags(point_name, kv_tags)
 
         # Add mod field from existing point for optimistic locking (required for updates)
         mod_val = sky_point.get("mod")
@@ -973,7 +1225,7 @@ class PointSyncService:
         if existing_tz != site_tz:
             logger.info(
                 "point_tz_updating",
-                point=ace_point["name"],
+                point=point_name,
                 old_tz=existing_tz,
                 new_tz=site_tz,
             )
@@ -991,6 +1243,52 @@ class PointSyncService:
             kv_tags=final_kv_tags,
         )
 
+    def _point_matches_skyspark(self, point: Point, sky_point: dict[str, Any]) -> bool:
+        """Check whether an existing SkySpark point already holds a prepared update.
+
+        Compares the tags the update would send against the point as SkySpark
+        returned it, ignoring ``mod``. Tags SkySpark has on top of those (e.g. ones
+        added by users) don't count as a change; an edited synced tag does, so the
+        next sync writes it back.
+
+        Args:
+            point: Prepared SkySpark point update
+            sky_point: Existing SkySpark point row
+
+        Returns:
+            True if sending the update would not change the point
+        """
+        try:
+            existing = Point.model_validate(sky_point).model_dump()
+        except Exception:
+            # A row the model can't read is treated as changed
+            return False
+        return all(
+            existing.get(key) == val for key, val in point.model_dump().items() if key != "mod"
+        )
+
+    def _ace_refs_current(
+        self, ace_point: dict[str, Any], sky_point: dict[str, Any], site_tz: str
+    ) -> bool:
+        """Check whether an ACE point already carries the refs ``_store_refs_to_ace`` writes.
+
+        Args:
+            ace_point: ACE point dictionary
+            sky_point: Matching SkySpark point row
+            site_tz: SkySpark site's timezone
+
+        Returns:
+            True if the ACE kv_tags match the SkySpark refs and timezone
+        """
+        kv_tags = ace_point.get("kv_tags") or {}
+        return (
+            kv_tags.get(self.HAYSTACK_REF_TAG) == _ref_value(sky_point.get("id"))
+            and kv_tags.get(self.HAYSTACK_SITE_REF_TAG) == _ref_value(sky_point.get("siteRef"))
+            and kv_tags.get(self.HAYSTACK_EQUIP_REF_TAG) == _ref_value(sky_point.get("equipRef"))
+            and kv_tags.get("tz") == site_tz
+            and kv_tags.get(self.SKYSPARK_TZ_TAG) == site_tz
+        )
+
     async def _create_points_batch_resilient(
         self,
         points: list[Point],
@@ -1000,7 +1298,8 @@ class PointSyncService:
         """Create points in SkySpark in batches with resilient error handling.
 
         Stores refs back to ACE after each successful batch to enable recovery.
-        Continues processing even if a batch fails.
+        Batches run concurrently up to app.max_concurrent; a failed batch does not
+        stop the others.
 
         Args:
             points: List of Point models to create
@@ -1010,49 +1309,47 @@ class PointSyncService:
         Returns:
             Tuple of (successful_count, failed_count)
         """
-        batch_size = self.config.app.batch_size
-        successful_count = 0
-        failed_count = 0
-
-        for i in range(0, len(points), batch_size):
-            batch = points[i : i + batch_size]
-            ace_batch = ace_points[i : i + batch_size]
-            batch_num = i // batch_size + 1
-
-            logger.info("creating_points_batch", batch_num=batch_num, size=len(batch))
+        if not points:
+            return 0, 0
 
-            try:
-                # Create batch in SkySpark
-                created = await self.skyspark_client.create_points(batch)
-                logger.info("points_created", count=len(created))
+        batch_size = self.config.app.batch_size
 
-                # CRITICAL: Store refs back to ACE immediately after successful batch
-                # This ensures recovery if next batch fails
+        async def create_batch(i: int, batch_num: int) -> tuple[int, int]:
+            # Hold a write slot only for the SkySpark request, so this batch's ref
+            # storage overlaps with the next batch's create
+            async with self._write_slot():
+                batch = points[i : i + batch_size]
+                logger.info("creating_points_batch", batch_num=batch_num, size=len(batch))
                 try:
-                    await self._store_refs_to_ace(ace_batch, created, site_tz)
-                    successful_count += len(created)
-                    logger.info("refs_stored_for_batch", batch_num=batch_num, count=len(created))
-                except Exception as ref_error:
-                    # Point creation succeeded but ref storage failed
-                    # This is recoverable - refs can be synced later with sync-refs-from-skyspark
+                    created = await self.skyspark_client.create_points(batch)
+                except Exception as e:
                     logger.error(
-                        "ref_storage_failed_for_batch",
+                        "create_batch_failed",
+                        error=str(e),
+                        batch_start=i,
                         batch_num=batch_num,
-                        error=str(ref_error),
-                        message="Points created but refs not stored - run sync-refs-from-skyspark to fix",
+                        message="Continuing with remaining batches...",
                     )
-                    successful_count += len(created)
+                    return 0, len(batch)
+            logger.info("points_created", count=len(created))
 
-            except Exception as e:
+            # CRITICAL: Store refs back to ACE immediately after successful batch
+            # This ensures recovery if another batch fails
+            try:
+                await self._store_refs_to_ace(ace_points[i : i + batch_size], created, site_tz)
+                logger.info("refs_stored_for_batch", batch_num=batch_num, count=len(created))
+            except Exception as ref_error:
+                # Point creation succeeded but ref storage failed
+                # This is recoverable - refs can be synced later with sync-refs-from-skyspark
                 logger.error(
-                    "create_batch_failed",
-                    error=str(e),
-                    batch_start=i,
+                    "ref_storage_failed_for_batch",
                     batch_num=batch_num,
-                    message="Continuing with next batch...",
+                    error=str(ref_error),
+                    message="Points created but refs not stored - run sync-refs-from-skyspark to fix",
                 )
-                failed_count += len(batch)
-                # Continue to next batch instead of raising
+            return len(created), 0
+
+        successful_count, failed_count = await self._gather_write_batches(len(points), create_batch)
 
         logger.info(
             "create_batches_complete",
@@ -1062,31 +1359,84 @@ class PointSyncService:
         )
         return successful_count, failed_count
 
-    async def _create_points_batch(self, points: list[Point]) -> list[dict[str, Any]]:
-        """Create points in SkySpark in batches (legacy - used internally).
+    async def _store_refs_batched(
+        self,
+        ace_points: list[dict[str, Any]],
+        skyspark_points: list[dict[str, Any]],
+        site_tz: str,
+    ) -> tuple[int, int]:
+        """Store refs for already-matched ACE/SkySpark point pairs in batches.
+
+        Used for points whose SkySpark update was skipped but whose ACE refs are
+        stale. Each ``app.batch_size`` chunk is one ACE request holding a write slot.
 
         Args:
-            points: List of points to create
+            ace_points: ACE point dicts needing their refs stored
+            skyspark_points: Matching SkySpark points, in the same order
+            site_tz: SkySpark site's timezone to store in ACE
 
         Returns:
-            List of created point dictionaries
+            Tuple of (successful_count, failed_count)
         """
-        batch_size = self.config.app.batch_size
-        created_points: list[dict[str, Any]] = []
+        if not ace_points:
+            return 0, 0
 
-        for i in range(0, len(points), batch_size):
-            batch = points[i : i + batch_size]
-            logger.info("creating_points_batch", batch_num=i // batch_size + 1, size=len(batch))
+        batch_size = self.config.app.batch_size
 
+        async def store_batch(i: int, batch_num: int) -> tuple[int, int]:
+            batch = ace_points[i : i + batch_size]
             try:
-                created = await self.skyspark_client.create_points(batch)
-                created_points.extend(created)
-                logger.info("points_created", count=len(created))
+                async with self._write_slot():
+                    await self._store_refs_to_ace(
+                        batch, skyspark_points[i : i + batch_size], site_tz
+                    )
             except Exception as e:
-                logger.error("create_batch_failed", error=str(e), batch_start=i)
-                raise
+                logger.error(
+                    "ref_refresh_failed_for_batch",
+                    batch_num=batch_num,
+                    error=str(e),
+                    size=len(batch),
+                )
+                return 0, len(batch)
+            return len(batch), 0
+
+        return await self._gather_write_batches(len(ace_points), store_batch)
 
-        return created_points
+    async def _gather_write_batches(
+        self,
+        total: int,
+        run_batch: Callable[[int, int], Awaitable[tuple[int, int]]],
+    ) -> tuple[int, int]:
+        """Run write batches concurrently and total their results.
+
+        Splits ``total`` items into ``app.batch_size`` chunks and awaits
+        ``run_batch(start, batch_num)`` for each one. Each batch holds
+        ``_write_slot()`` around its write request only, so follow-up work such as
+        ref storage overlaps with the next batch's request.
+
+        Args:
+            total: Number of items to write
+            run_batch: Coroutine function writing one batch, returning
+                (successful_count, failed_count)
+
+        Returns:
+            Tuple of (successful_count, failed_count) summed over all batches
+        """
+        batch_size = self.config.app.batch_size
+        results = await asyncio.gather(
+            *(run_batch(i, i // batch_size + 1) for i in range(0, total, batch_size))
+        )
+        return sum(ok for ok, _ in results), sum(failed for _, failed in results)
+
+    def _write_slot(self) -> asyncio.Semaphore:
+        """Return the service-wide semaphore bounding write requests in flight.
+
+        Sized by ``app.max_concurrent`` and shared by every writer, so concurrent
+        creates, updates and ref writes together stay within the bound.
+        """
+        if self._write_semaphore is None:
+            self._write_semaphore = asyncio.Semaphore(self.config.app.max_concurrent)
+        return self._write_semaphore
 
     async def _update_points_batch_resilient(
         self,
@@ -1097,7 +1447,8 @@ class PointSyncService:
         """Update points in SkySpark in batches with resilient error handling.
 
         Stores refs back to ACE after each successful batch to enable recovery.
-        Continues processing even if a batch fails.
+        Batches run concurrently up to app.max_concurrent; a failed batch does not
+        stop the others.
 
         Args:
             points: List of Point models to update
@@ -1107,47 +1458,45 @@ class PointSyncService:
         Returns:
             Tuple of (successful_count, failed_count)
         """
-        batch_size = self.config.app.batch_size
-        successful_count = 0
-        failed_count = 0
+        if not points:
+            return 0, 0
 
-        for i in range(0, len(points), batch_size):
-            batch = points[i : i + batch_size]
-            ace_batch = ace_points[i : i + batch_size]
-            batch_num = i // batch_size + 1
-
-            logger.info("updating_points_batch", batch_num=batch_num, size=len(batch))
-
-            try:
-                # Update batch in SkySpark
-                updated = await self.skyspark_client.update_points(batch)
-                logger.info("points_updated", count=len(updated))
+        batch_size = self.config.app.batch_size
 
-                # Store updated refs back to ACE (fixes orphaned refs)
+        async def update_batch(i: int, batch_num: int) -> tuple[int, int]:
+            # Hold a write slot only for the SkySpark request, so this batch's ref
+            # storage overlaps with the next batch's update
+            async with self._write_slot():
+                batch = points[i : i + batch_size]
+                logger.info("updating_points_batch", batch_num=batch_num, size=len(batch))
                 try:
-                    await self._store_refs_to_ace(ace_batch, updated, site_tz)
-                    successful_count += len(updated)
-                    logger.info("refs_stored_for_batch", batch_num=batch_num, count=len(updated))
-                except Exception as ref_error:
-                    # Point update succeeded but ref storage failed
+                    updated = await self.skyspark_client.update_points(batch)
+                except Exception as e:
                     logger.error(
-                        "ref_storage_failed_for_batch",
+                        "update_batch_failed",
+                        error=str(e),
+                        batch_start=i,
                         batch_num=batch_num,
-                        error=str(ref_error),
-                        message="Points updated but refs not stored - run sync-refs-from-skyspark to fix",
+                        message="Continuing with remaining batches...",
                     )
-                    successful_count += len(updated)
+                    return 0, len(batch)
+            logger.info("points_updated", count=len(updated))
 
-            except Exception as e:
+            # Store updated refs back to ACE (fixes orphaned refs)
+            try:
+                await self._store_refs_to_ace(ace_points[i : i + batch_size], updated, site_tz)
+                logger.info("refs_stored_for_batch", batch_num=batch_num, count=len(updated))
+            except Exception as ref_error:
+                # Point update succeeded but ref storage failed
                 logger.error(
-                    "update_batch_failed",
-                    error=str(e),
-                    batch_start=i,
+                    "ref_storage_failed_for_batch",
                     batch_num=batch_num,
-                    message="Continuing with next batch...",
+                    error=str(ref_error),
+                    message="Points updated but refs not stored - run sync-refs-from-skyspark to fix",
                 )
-                failed_count += len(batch)
-                # Continue to next batch instead of raising
+            return len(updated), 0
+
+        successful_count, failed_count = await self._gather_write_batches(len(points), update_batch)
 
         logger.info(
             "update_batches_complete",
@@ -1157,32 +1506,6 @@ class PointSyncService:
         )
         return successful_count, failed_count
 
-    async def _update_points_batch(self, points: list[Point]) -> list[dict[str, Any]]:
-        """Update points in SkySpark in batches (legacy - used internally).
-
-        Args:
-            points: List of points to update
-
-        Returns:
-            List of updated point dictionaries
-        """
-        batch_size = self.config.app.batch_size
-        updated_points: list[dict[str, Any]] = []
-
-        for i in range(0, len(points), batch_size):
-            batch = points[i : i + batch_size]
-            logger.info("updating_points_batch", batch_num=i // batch_size + 1, size=len(batch))
-
-            try:
-                updated = await self.skyspark_client.update_points(batch)
-                updated_points.extend(updated)
-                logger.info("points_updated", count=len(updated))
-            except Exception as e:
-                logger.error("update_batch_failed", error=str(e), batch_start=i)
-                raise
-
-        return updated_points
-
     async def sync_refs_from_skyspark(
         self,
         site: str | None = None,
@@ -1208,25 +1531,24 @@ class PointSyncService:
         errors: list[str] = []
 
         try:
-            # Read all points from SkySpark
-            skyspark_points = await self._fetch_skyspark_points()
+            # Read only points synced from ACE (the filter keeps non-ACE points server-side)
+            skyspark_points = await self._fetch_skyspark_points(
+                filter_expr=f"point and {self.ACE_TOPIC_TAG}"
+            )
             logger.info("skyspark_points_fetched", count=len(skyspark_points))
 
-            # Filter points that have ace_topic tag
-            points_with_topic = []
+            # Split each topic once and optionally filter by site.
+            # ace_topic format: client/site/point_name (point_name may contain slashes)
+            points_with_topic: list[tuple[dict[str, Any], str, list[str]]] = []
             for sky_point in skyspark_points:
-                ace_topic = sky_point.get("ace_topic")
-                if ace_topic:
-                    # Optionally filter by site
-                    if site:
-                        # ace_topic format: client/site/point_name
-                        topic_parts = ace_topic.split("/")
-                        if len(topic_parts) >= 2:
-                            point_site = topic_parts[1]
-                            if point_site != site:
-                                continue
-
-                    points_with_topic.append(sky_point)
+                ace_topic = sky_point.get(self.ACE_TOPIC_TAG)
+                if not ace_topic:
+                    continue
+                topic_parts = ace_topic.split("/", 2)
+                if site and len(topic_parts) >= 2 and topic_parts[1] != site:
+                    continue
+
+                points_with_topic.append((sky_point, ace_topic, topic_parts))
 
             points_found = len(points_with_topic)
             logger.info("points_with_ace_topic", count=points_found, site_filter=site)
@@ -1242,44 +1564,22 @@ class PointSyncService:
 
             # Build ACE point updates with refs
             ace_points_to_update: list[dict[str, Any]] = []
+            debug = _stdlib_logger.isEnabledFor(logging.DEBUG)
 
-            for sky_point in points_with_topic:
+            for sky_point, ace_topic, topic_parts in points_with_topic:
                 try:
-                    # Extract ace_topic (this is the ACE point name)
-                    ace_topic = sky_point.get("ace_topic")
-                    if not ace_topic:
-                        points_skipped += 1
-                        continue
-
-                    # Parse ace_topic: client/site/point_name
-                    topic_parts = ace_topic.split("/")
+                    # ace_topic is the ACE point name: client/site/point_name
                     if len(topic_parts) < 3:
                         logger.warning("invalid_ace_topic_format", topic=ace_topic)
                         points_skipped += 1
                         continue
 
-                    client_name = topic_parts[0]
-                    site_name = topic_parts[1]
-                    point_name = "/".join(topic_parts[2:])  # Handle slashes in point name
+                    client_name, site_name, point_name = topic_parts
 
                     # Extract SkySpark refs
-                    sky_id = sky_point.get("id", {})
-                    if isinstance(sky_id, dict):
-                        sky_id_val = sky_id.get("val", "").lstrip("@")
-                    else:
-                        sky_id_val = str(sky_id).lstrip("@")
-
-                    site_ref = sky_point.get("siteRef", {})
-                    if isinstance(site_ref, dict):
-                        site_ref_val = site_ref.get("val", "").lstrip("@")
-                    else:
-                        site_ref_val = str(site_ref).lstrip("@")
-
-                    equip_ref = sky_point.get("equipRef", {})
-                    if isinstance(equip_ref, dict):
-                        equip_ref_val = equip_ref.get("val", "").lstrip("@")
-                    else:
-                        equip_ref_val = str(equip_ref).lstrip("@")
+                    sky_id_val = _ref_value(sky_point.get("id"))
+                    site_ref_val = _ref_value(sky_point.get("siteRef"))
+                    equip_ref_val = _ref_value(sky_point.get("equipRef"))
 
                     if not sky_id_val:
                         logger.warning("skyspark_point_missing_id", ace_topic=ace_topic)
@@ -1292,10 +1592,10 @@ class PointSyncService:
                     # Build KV tags update
                     updated_kv_tags = {
                         self.HAYSTACK_REF_TAG: sky_id_val,
-                        "haystack_siteRef": site_ref_val,
-                        "haystack_equipRef": equip_ref_val,
+                        self.HAYSTACK_SITE_REF_TAG: site_ref_val,
+                        self.HAYSTACK_EQUIP_REF_TAG: equip_ref_val,
                         "tz": sky_tz,  # Store SkySpark tz field
-                        "skysparkTz": sky_tz,  # Store same timezone for legacy compatibility
+                        self.SKYSPARK_TZ_TAG: sky_tz,  # Store same timezone for legacy compatibility
                     }
 
                     # Create minimal point update
@@ -1307,14 +1607,15 @@ class PointSyncService:
                     }
 
                     ace_points_to_update.append(updated_point)
-                    logger.debug(
-                        "prepared_ref_update_from_skyspark",
-                        point_name=point_name,
-                        skyspark_id=sky_id_val,
-                        site_ref=site_ref_val,
-                        equip_ref=equip_ref_val,
-                        tz=sky_tz,
-                    )
+                    if debug:
+                        logger.debug(
+                            "prepared_ref_update_from_skyspark",
+                            point_name=point_name,
+                            skyspark_id=sky_id_val,
+                            site_ref=site_ref_val,
+                            equip_ref=equip_ref_val,
+                            tz=sky_tz,
+                        )
 
                 except Exception as e:
                     error_msg = (
@@ -1334,23 +1635,32 @@ class PointSyncService:
                     "errors": errors,
                 }
 
-            # Update ACE points with refs
+            # Update ACE points with refs, one batch_size chunk per request
             if not dry_run:
-                loop = asyncio.get_event_loop()
-                try:
-                    await loop.run_in_executor(
-                        None,
-                        self.ace_client.create_points,
-                        ace_points_to_update,
-                        False,  # overwrite_m_tags
-                        False,  # overwrite_kv_tags (merge mode)
-                    )
-                    refs_updated = len(ace_points_to_update)
-                    logger.info("refs_synced_from_skyspark_to_ace", count=refs_updated)
-                except Exception as e:
-                    error_msg = f"Failed to update ACE points: {e!s}"
-                    logger.error("batch_ref_update_failed", error=str(e))
-                    errors.append(error_msg)
+                batch_size = self.config.app.batch_size
+
+                async def store_batch(i: int, batch_num: int) -> tuple[int, int]:
+                    batch = ace_points_to_update[i : i + batch_size]
+                    try:
+                        async with self._write_slot():
+                            await self._ace_create_points(batch)
+                    except Exception as e:
+                        logger.error(
+                            "batch_ref_update_failed",
+                            error=str(e),
+                            batch_num=batch_num,
+                            size=len(batch),
+                        )
+                        errors.append(
+                            f"Failed to update ACE points {i + 1}-{i + len(batch)}: {e!s}"
+                        )
+                        return 0, len(batch)
+                    return len(batch), 0
+
+                refs_updated, _ = await self._gather_write_batches(
+                    len(ace_points_to_update), store_batch
+                )
+                logger.info("refs_synced_from_skyspark_to_ace", count=refs_updated)
             else:
                 logger.info(
                     "dry_run_would_update_refs",
@@ -1387,83 +1697,167 @@ class PointSyncService:
             skyspark_points: Created SkySpark points with IDs and references
             site_tz: SkySpark site's timezone to store in ACE
         """
-        logger.info("storing_refs_to_ace", count=len(skyspark_points), site_tz=site_tz)
-
-        # Build batch of point updates with haystackRef, siteRef, and equipRef tags
-        points_to_update: list[dict[str, Any]] = []
-
-        for ace_point, sky_point in zip(ace_points, skyspark_points, strict=False):
-            # Extract SkySpark references
-            sky_id = sky_point.get("id", {}).get("val", "").lstrip("@")
-            site_ref = sky_point.get("siteRef", {})
-            equip_ref = sky_point.get("equipRef", {})
-
-            if not sky_id:
-                logger.warning("no_id_in_skyspark_point", point=ace_point.get("name", "unknown"))
-                continue
+        if not ace_points or not skyspark_points:
+            return
 
-            # Extract ref values from dict format
-            if isinstance(site_ref, dict):
-                site_ref_val = site_ref.get("val", "").lstrip("@")
-            else:
-                site_ref_val = str(site_ref).lstrip("@")
+        logger.info("storing_refs_to_ace", count=len(skyspark_points), site_tz=site_tz)
 
-            if isinstance(equip_ref, dict):
-                equip_ref_val = equip_ref.get("val", "").lstrip("@")
+        # Join SkySpark results to ACE points by the ace_topic each point was sent with
+        # (an ace_topic kv tag in ACE overrides the name) so a reordered or partial
+        # response can't attach refs to the wrong point
+        topic_tag = self.ACE_TOPIC_TAG
+        ace_by_topic: dict[str, dict[str, Any] | None] = {}
+        for ace_point in ace_points:
+            kv_tags: dict[str, Any] = ace_point.get("kv_tags") or {}
+            ace_topic: str = kv_tags[topic_tag] if topic_tag in kv_tags else ace_point["name"]
+            # Two ACE points sent with the same topic can't be told apart
+            ace_by_topic[ace_topic] = None if ace_topic in ace_by_topic else ace_point
+        # Request order is only trustworthy when every point came back
+        positional = len(skyspark_points) == len(ace_points)
+        matched_ace: list[dict[str, Any]] = []
+        matched_sky: list[dict[str, Any]] = []
+        for i, sky_point in enumerate(skyspark_points):
+            topic = sky_point.get(topic_tag)
+            if topic:
+                ace_point = ace_by_topic.get(topic)
+                if ace_point is None:
+                    logger.warning("no_ace_point_for_skyspark_point", ace_topic=topic)
+                    continue
+            elif positional:
+                # Result without ace_topic: fall back to request order
+                ace_point = ace_points[i]
             else:
-                equip_ref_val = str(equip_ref).lstrip("@")
-
-            # Use SkySpark site's timezone (not point's tz field)
-            # SkySpark site is source of truth for timezone
-
-            # Merge all refs and timezone info into existing kv_tags
-            existing_kv_tags = ace_point.get("kv_tags") or {}
-            updated_kv_tags = {
-                **existing_kv_tags,
-                self.HAYSTACK_REF_TAG: sky_id,
-                "haystack_siteRef": site_ref_val,
-                "haystack_equipRef": equip_ref_val,
-                "tz": site_tz,  # Store SkySpark site's timezone
-                "skysparkTz": site_tz,  # Store same timezone for legacy compatibility
-            }
+                logger.warning("unmatched_skyspark_point", id=_ref_value(sky_point.get("id")))
+                continue
+            matched_ace.append(ace_point)
+            matched_sky.append(sky_point)
+
+        # Stage SkySpark refs column-wise, then assemble the ACE updates in one pass
+        sky_ids = [_ref_value(sp.get("id")) for sp in matched_sky]
+        site_ref_vals = [_ref_value(sp.get("siteRef")) for sp in matched_sky]
+        equip_ref_vals = [_ref_value(sp.get("equipRef")) for sp in matched_sky]
+
+        if not all(sky_ids):
+            for ace_point, sky_id in zip(matched_ace, sky_ids, strict=False):
+                if not sky_id:
+                    logger.warning(
+                        "no_id_in_skyspark_point", point=ace_point.get("name", "unknown")
+                    )
 
-            # Create minimal point update with required fields
-            # Note: Do NOT include bacnet_data as it may contain empty strings that cause backend errors
-            updated_point = {
+        # Bind tag names once instead of looking them up on self for every point
+        ref_tag = self.HAYSTACK_REF_TAG
+        site_ref_tag = self.HAYSTACK_SITE_REF_TAG
+        equip_ref_tag = self.HAYSTACK_EQUIP_REF_TAG
+        tz_tag = self.SKYSPARK_TZ_TAG
+
+        # Merge all refs and timezone info into existing kv_tags
+        # SkySpark site is source of truth for timezone (not point's tz field)
+        # Note: Do NOT include bacnet_data as it may contain empty strings that cause backend errors
+        points_to_update: list[dict[str, Any]] = [
+            {
                 "name": ace_point["name"],
                 "client": ace_point["client"],
                 "site": ace_point["site"],
-                "kv_tags": updated_kv_tags,
+                "kv_tags": {
+                    **(ace_point.get("kv_tags") or {}),
+                    ref_tag: sky_id,
+                    site_ref_tag: site_ref_val,
+                    equip_ref_tag: equip_ref_val,
+                    "tz": site_tz,  # Store SkySpark site's timezone
+                    tz_tag: site_tz,  # Same timezone for legacy compatibility
+                },
             }
-
-            points_to_update.append(updated_point)
-            logger.debug(
-                "prepared_ref_update",
-                ace_point=ace_point["name"],
-                skyspark_id=sky_id,
-                site_ref=site_ref_val,
-                equip_ref=equip_ref_val,
+            for ace_point, sky_id, site_ref_val, equip_ref_val in zip(
+                matched_ace, sky_ids, site_ref_vals, equip_ref_vals, strict=False
             )
+            if sky_id
+        ]
+        logger.debug("prepared_ref_updates", count=len(points_to_update))
 
         if not points_to_update:
             logger.warning("no_refs_to_store")
             return
 
         # Batch update using create_points with overwrite_kv_tags=False to merge
-        loop = asyncio.get_event_loop()
         try:
-            await loop.run_in_executor(
-                None,
-                self.ace_client.create_points,
-                points_to_update,
-                False,  # overwrite_m_tags
-                False,  # overwrite_kv_tags (merge mode)
-            )
+            await self._ace_create_points(points_to_update)
             logger.info("refs_stored_to_ace", count=len(points_to_update))
         except Exception as e:
             logger.error("batch_ref_storage_failed", error=str(e), count=len(points_to_update))
             raise
 
+    async def _call_ace(self, method: str, *args: Any) -> Any:
+        """Call an ACE API method, preferring the async client.
+
+        The async and sync ACE clients expose the same method names. When the async
+        client is available the call is awaited directly on the event loop; otherwise
+        the sync client runs on the service's own worker threads (``app.max_concurrent``
+        of them), so it doesn't compete with other users of the default executor.
+        Every call first takes a token from the ACE rate limiter, and async calls that
+        fail with 429/5xx or a connection error are retried with exponential backoff
+        and jitter.
+
+        Args:
+            method: ACE client method name (e.g. "get_site")
+            *args: Positional arguments for the method
+
+        Returns:
+            ACE API response
+        """
+        if self._ace_limiter is None and self.config.app.ace_rate_limit > 0:
+            self._ace_limiter = AsyncTokenBucket(self.config.app.ace_rate_limit)
+
+        if self.ace_async_client is None:
+            # Sync client retries 429/5xx itself (urllib3 Retry)
+            if self._ace_limiter is not None:
+                await self._ace_limiter.acquire()
+            if self._ace_executor is None:
+                self._ace_executor = ThreadPoolExecutor(
+                    max_workers=self.config.app.max_concurrent, thread_name_prefix="ace-api"
+                )
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._ace_executor, getattr(self.ace_client, method), *args
+            )
+
+        max_retries = self.config.app.ace_max_retries
+        attempt = 0
+        while True:
+            if self._ace_limiter is not None:
+                await self._ace_limiter.acquire()
+            try:
+                return await getattr(self.ace_async_client, method)(*args)
+            except APIError as e:
+                retryable = e.status_code is None or e.status_code in RETRYABLE_ACE_STATUSES
+                if not retryable or attempt >= max_retries:
+                    raise
+                delay = min(2**attempt, 30) * random.uniform(0.5, 1.0)
+                attempt += 1
+                logger.warning(
+                    "ace_request_retrying",
+                    method=method,
+                    status_code=e.status_code,
+                    attempt=attempt,
+                    delay=round(delay, 2),
+                )
+                await asyncio.sleep(delay)
+
+    async def _ace_create_points(self, points: list[dict[str, Any]]) -> dict[str, Any]:
+        """Merge point updates into ACE via create_points.
+
+        Args:
+            points: Point dictionaries to create or merge
+
+        Returns:
+            ACE API response
+        """
+        return await self._call_ace(
+            "create_points",
+            points,
+            False,  # overwrite_m_tags
+            False,  # overwrite_kv_tags (merge mode)
+        )
+
     async def write_history(
         self,
         site: str,
@@ -1520,8 +1914,7 @@ class PointSyncService:
 
             # Fetch points from ACE for this site
             logger.info("fetching_ace_points", site=site)
-            loop = asyncio.get_event_loop()
-            ace_points = await loop.run_in_executor(None, self.ace_client.get_site_points, site)
+            ace_points = await self._call_ace("get_site_points", site)
 
             if not ace_points:
                 logger.warning("no_points_found", site=site)
@@ -1577,12 +1970,8 @@ class PointSyncService:
                     )
 
                     # Read timeseries from ACE
-                    ts_data = await loop.run_in_executor(
-                        None,
-                        self.ace_client.get_point_timeseries,
-                        point_name,
-                        start_time,
-                        end_time,
+                    ts_data = await self._call_ace(
+                        "get_point_timeseries", point_name, start_time, end_time
                     )
 
                     # Extract samples
@@ -1,13 +1,17 @@
 """Pytest configuration and shared fixtures."""
 
 import os
+from collections.abc import AsyncIterator, Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from ace_skyspark_lib import Equipment, Point, Site
+import pytest_asyncio
+from ace_skyspark_lib import Equipment, Point, Site, SkysparkClient
 from aceiot_models import Point as FlightDeckPoint
+from aceiot_models.api import APIClient
 from dotenv import load_dotenv
 
 # Load .env file at the start of test session
@@ -15,41 +19,67 @@ env_path = Path(__file__).parent.parent / ".env"
 load_dotenv(env_path)
 
 
-@pytest.fixture
-def env_config() -> dict[str, str]:
+INTEGRATION_CONFIG_VARS = {
+    "flightdeck_user": "TEST_FLIGHTDECK_USER",
+    "flightdeck_jwt": "TEST_FLIGHTDECK_JWT",
+    "flightdeck_site": "TEST_FLIGHTDECK_SITE",
+    "skyspark_url": "TEST_SKYSPARK_URL",
+    "skyspark_project": "TEST_SKYSPARK_PROJECT",
+    "skyspark_user": "TEST_SKYSPARK_USER",
+    "skyspark_pass": "TEST_SKYSPARK_PASS",
+}
+
+
+def _load_env_config() -> Mapping[str, str]:
+    """Read the integration settings from the environment as a read-only mapping."""
+    return MappingProxyType(
+        {key: os.getenv(var, "") for key, var in INTEGRATION_CONFIG_VARS.items()}
+    )
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Skip every integration test up front when its configuration is incomplete.
+
+    The environment is checked once per session rather than by a fixture in each
+    test, so no SkySpark fixture is ever set up for a run that cannot connect.
+    """
+    config = _load_env_config()
+    missing = [key for key, value in config.items() if not value]
+    if not missing:
+        return
+    skip = pytest.mark.skip(reason=f"Missing integration config: {', '.join(missing)}")
+    for item in items:
+        if item.get_closest_marker("integration"):
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def env_config() -> Mapping[str, str]:
     """Load test configuration from environment variables."""
-    return {
-        "flightdeck_user": os.getenv("TEST_FLIGHTDECK_USER", ""),
-        "flightdeck_jwt": os.getenv("TEST_FLIGHTDECK_JWT", ""),
-        "flightdeck_site": os.getenv("TEST_FLIGHTDECK_SITE", ""),
-        "skyspark_url": os.getenv("TEST_SKYSPARK_URL", ""),
-        "skyspark_project": os.getenv("TEST_SKYSPARK_PROJECT", ""),
-        "skyspark_user": os.getenv("TEST_SKYSPARK_USER", ""),
-        "skyspark_pass": os.getenv("TEST_SKYSPARK_PASS", ""),
-    }
+    return _load_env_config()
 
 
-@pytest.fixture
-def skip_if_no_integration_config(env_config: dict[str, str]) -> None:
-    """Skip test if integration configuration is not available."""
-    required_keys = [
-        "flightdeck_user",
-        "flightdeck_jwt",
-        "flightdeck_site",
-        "skyspark_url",
-        "skyspark_project",
-        "skyspark_user",
-        "skyspark_pass",
-    ]
-    missing = [k for k in required_keys if not env_config.get(k)]
-    if missing:
-        pytest.skip(f"Missing integration config: {', '.join(missing)}")
+@pytest_asyncio.fixture(scope="session")
+async def skyspark_client(env_config: Mapping[str, str]) -> AsyncIterator[SkysparkClient]:
+    """Connected SkySpark client shared by every integration test in the session.
+
+    Tests and async fixtures run on one session-wide event loop (see
+    pyproject.toml), so a single login and connection pool can serve the
+    whole run.
+    """
+    async with SkysparkClient(
+        base_url=env_config["skyspark_url"],
+        project=env_config["skyspark_project"],
+        username=env_config["skyspark_user"],
+        password=env_config["skyspark_pass"],
+    ) as client:
+        yield client
 
 
 @pytest.fixture
 def mock_flightdeck_client() -> MagicMock:
-    """Mock FlightDeck client for unit tests."""
-    client = MagicMock()
+    """Mock FlightDeck client for unit tests, specced against the sync APIClient."""
+    client = MagicMock(spec=APIClient)
     client.get_points = AsyncMock(return_value=[])
     client.update_point = AsyncMock()
     client.get_site = AsyncMock()
@@ -58,8 +88,12 @@ def mock_flightdeck_client() -> MagicMock:
 
 @pytest.fixture
 def mock_skyspark_client() -> MagicMock:
-    """Mock SkySpark client for unit tests."""
-    client = MagicMock()
+    """Mock SkySpark client for unit tests.
+
+    Specced against SkysparkClient so attributes the real client lacks raise
+    instead of being auto-created.
+    """
+    client = MagicMock(spec=SkysparkClient)
     client.__aenter__ = AsyncMock(return_value=client)
     client.__aexit__ = AsyncMock(return_value=None)
     client.read_sites = AsyncMock(return_value=[])
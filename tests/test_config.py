@@ -1,15 +1,24 @@
 """Tests for configuration loading and validation."""
 
 import os
+from collections.abc import Mapping
+from contextlib import nullcontext
+from types import SimpleNamespace
+from typing import cast
+from unittest.mock import MagicMock
 
 import pytest
+from aceiot_models.api import AsyncAPIClient
+
+import ace_skyspark_cli as cli
+from ace_skyspark_cli.config import AppConfig, Config
 
 
 class TestConfiguration:
     """Test configuration loading from environment variables."""
 
     @pytest.mark.unit
-    def test_env_config_loads_all_variables(self, env_config: dict[str, str]) -> None:
+    def test_env_config_loads_all_variables(self, env_config: Mapping[str, str]) -> None:
         """Test that all expected environment variables are loaded."""
         expected_keys = {
             "flightdeck_user",
@@ -23,49 +32,49 @@ class TestConfiguration:
         assert set(env_config.keys()) == expected_keys
 
     @pytest.mark.unit
-    def test_flightdeck_user_from_env(self, env_config: dict[str, str]) -> None:
+    def test_flightdeck_user_from_env(self, env_config: Mapping[str, str]) -> None:
         """Test FlightDeck user is loaded from TEST_FLIGHTDECK_USER."""
         expected = os.getenv("TEST_FLIGHTDECK_USER", "")
         assert env_config["flightdeck_user"] == expected
 
     @pytest.mark.unit
-    def test_flightdeck_jwt_from_env(self, env_config: dict[str, str]) -> None:
+    def test_flightdeck_jwt_from_env(self, env_config: Mapping[str, str]) -> None:
         """Test FlightDeck JWT is loaded from TEST_FLIGHTDECK_JWT."""
         expected = os.getenv("TEST_FLIGHTDECK_JWT", "")
         assert env_config["flightdeck_jwt"] == expected
 
     @pytest.mark.unit
-    def test_flightdeck_site_from_env(self, env_config: dict[str, str]) -> None:
+    def test_flightdeck_site_from_env(self, env_config: Mapping[str, str]) -> None:
         """Test FlightDeck site is loaded from TEST_FLIGHTDECK_SITE."""
         expected = os.getenv("TEST_FLIGHTDECK_SITE", "")
         assert env_config["flightdeck_site"] == expected
 
     @pytest.mark.unit
-    def test_skyspark_url_from_env(self, env_config: dict[str, str]) -> None:
+    def test_skyspark_url_from_env(self, env_config: Mapping[str, str]) -> None:
         """Test SkySpark URL is loaded from TEST_SKYSPARK_URL."""
         expected = os.getenv("TEST_SKYSPARK_URL", "")
         assert env_config["skyspark_url"] == expected
 
     @pytest.mark.unit
-    def test_skyspark_project_from_env(self, env_config: dict[str, str]) -> None:
+    def test_skyspark_project_from_env(self, env_config: Mapping[str, str]) -> None:
         """Test SkySpark project is loaded from TEST_SKYSPARK_PROJECT."""
         expected = os.getenv("TEST_SKYSPARK_PROJECT", "")
         assert env_config["skyspark_project"] == expected
 
     @pytest.mark.unit
-    def test_skyspark_user_from_env(self, env_config: dict[str, str]) -> None:
+    def test_skyspark_user_from_env(self, env_config: Mapping[str, str]) -> None:
         """Test SkySpark user is loaded from TEST_SKYSPARK_USER."""
         expected = os.getenv("TEST_SKYSPARK_USER", "")
         assert env_config["skyspark_user"] == expected
 
     @pytest.mark.unit
-    def test_skyspark_pass_from_env(self, env_config: dict[str, str]) -> None:
+    def test_skyspark_pass_from_env(self, env_config: Mapping[str, str]) -> None:
         """Test SkySpark password is loaded from TEST_SKYSPARK_PASS."""
         expected = os.getenv("TEST_SKYSPARK_PASS", "")
         assert env_config["skyspark_pass"] == expected
 
     @pytest.mark.unit
-    def test_no_hardcoded_credentials_in_config(self, env_config: dict[str, str]) -> None:
+    def test_no_hardcoded_credentials_in_config(self, env_config: Mapping[str, str]) -> None:
         """Test that no hardcoded test credentials are present."""
         # This ensures we're always using environment variables
         for key, value in env_config.items():
@@ -115,3 +124,35 @@ class TestConfiguration:
         ]
         missing = [k for k in required_keys if not env_config.get(k)]
         assert len(missing) == len(required_keys), "All config should be missing"
+
+
+class TestClientCreation:
+    """Test ACE and SkySpark client construction."""
+
+    @pytest.mark.unit
+    async def test_create_clients_defaults_to_async_ace_client(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the default config yields the AsyncAPIClient from the locked aceiot-models."""
+        monkeypatch.setattr(cli, "logger", MagicMock())
+        monkeypatch.setattr(cli, "SkysparkClient", MagicMock(return_value=nullcontext()))
+        config = cast(
+            "Config",
+            SimpleNamespace(
+                flightdeck=SimpleNamespace(api_url="https://ace.example", jwt="jwt", timeout=30),
+                skyspark=SimpleNamespace(
+                    url="https://skyspark.example",
+                    project="proj",
+                    user="user",
+                    password="pass",
+                    timeout=30.0,
+                    max_retries=3,
+                    pool_size=10,
+                ),
+                app=AppConfig(),
+            ),
+        )
+
+        assert config.app.ace_async_http is True
+        async with cli.create_clients(config) as (_, _, ace_async_client):
+            assert isinstance(ace_async_client, AsyncAPIClient)
@@ -1,112 +1,96 @@
 """Tests for duplicate prevention."""
 
+from collections import defaultdict
 from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
 
-from tests.test_utils import find_by_ref_name, is_duplicate
+from tests.test_utils import find_by_ref_name, index_by_ref_name
 
 
-class TestDuplicateSiteDetection:
-    """Test duplicate site detection and prevention."""
+class TestDuplicateEntityDetection:
+    """Test duplicate site, equipment and point detection by refName."""
 
     @pytest.mark.unit
-    async def test_detect_duplicate_site_by_refname(self, mock_skyspark_client: MagicMock) -> None:
-        """Test detecting duplicate sites by refName."""
-        ref_name = "building-a"
-
-        # Existing sites
-        existing_sites = [
-            {"id": {"val": "p:aceTest:r:site-1"}, "refName": "building-a"},
-            {"id": {"val": "p:aceTest:r:site-2"}, "refName": "building-b"},
+    @pytest.mark.parametrize(
+        ("reader", "kind", "ref_name", "other_ref_name"),
+        [
+            ("read_sites", "site", "building-a", "building-b"),
+            ("read_equipment", "equip", "ahu-1", "rtu-1"),
+            ("read_points", "point", "temp-sensor-1", "humidity-sensor-1"),
+        ],
+    )
+    async def test_detect_duplicate_by_refname(
+        self,
+        mock_skyspark_client: MagicMock,
+        reader: str,
+        kind: str,
+        ref_name: str,
+        other_ref_name: str,
+    ) -> None:
+        """Test detecting a duplicate entity by refName."""
+        getattr(mock_skyspark_client, reader).return_value = [
+            {"id": {"val": f"p:aceTest:r:{kind}-1"}, "refName": ref_name},
+            {"id": {"val": f"p:aceTest:r:{kind}-2"}, "refName": other_ref_name},
         ]
-        mock_skyspark_client.read_sites.return_value = existing_sites
 
-        sites = await mock_skyspark_client.read_sites()
-        duplicate = find_by_ref_name(sites, ref_name)
+        entities = await getattr(mock_skyspark_client, reader)()
+        duplicate = find_by_ref_name(entities, ref_name)
 
         assert duplicate is not None
         assert duplicate["refName"] == ref_name
 
     @pytest.mark.unit
-    async def test_prevent_duplicate_site_creation(self, mock_skyspark_client: MagicMock) -> None:
-        """Test preventing duplicate site creation."""
-        ref_name = "building-a"
-
-        # Check for existing
-        existing_sites = [{"id": {"val": "p:aceTest:r:site-1"}, "refName": ref_name}]
-        mock_skyspark_client.read.return_value = existing_sites
+    @pytest.mark.parametrize(
+        ("kind", "ref_name"),
+        [("site", "building-a"), ("equip", "ahu-1"), ("point", "temp-sensor-1")],
+    )
+    async def test_prevent_duplicate_creation(
+        self, mock_skyspark_client: MagicMock, kind: str, ref_name: str
+    ) -> None:
+        """Test an existing entity with the same refName prevents creation."""
+        mock_skyspark_client.read.return_value = [
+            {"id": {"val": f"p:aceTest:r:{kind}-1"}, "refName": ref_name}
+        ]
 
-        existing = await mock_skyspark_client.read(f'site and refName=="{ref_name}"')
+        existing = await mock_skyspark_client.read(f'{kind} and refName=="{ref_name}"')
 
         # Don't create if exists
-        if existing:
-            should_create = False
-            site_id = existing[0]["id"]["val"]
-        else:
-            should_create = True
-            site_id = None
+        should_create, entity_id = (False, existing[0]["id"]["val"]) if existing else (True, None)
 
         assert should_create is False
-        assert site_id == "p:aceTest:r:site-1"
+        assert entity_id == f"p:aceTest:r:{kind}-1"
+
+
+class TestDuplicateSiteDetection:
+    """Test duplicate site detection and prevention."""
 
     @pytest.mark.unit
     def test_multiple_sites_with_same_refname_detected(self) -> None:
         """Test detecting multiple sites with same refName (data integrity issue)."""
-        sites = [
+        sites: list[dict[str, Any]] = [
             {"id": {"val": "p:aceTest:r:site-1"}, "refName": "duplicate"},
             {"id": {"val": "p:aceTest:r:site-2"}, "refName": "unique"},
             {"id": {"val": "p:aceTest:r:site-3"}, "refName": "duplicate"},
         ]
 
-        duplicates = [s for s in sites if is_duplicate(s, "duplicate")]
+        # Group by refName in one pass, then keep groups with more than one entity
+        groups: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+        for site in sites:
+            groups[site["refName"]].append(site)
+        duplicates = {ref_name: group for ref_name, group in groups.items() if len(group) > 1}
 
-        assert len(duplicates) == 2
+        assert list(duplicates) == ["duplicate"]
+        assert [s["id"]["val"] for s in duplicates["duplicate"]] == [
+            "p:aceTest:r:site-1",
+            "p:aceTest:r:site-3",
+        ]
 
 
 class TestDuplicatePointDetection:
     """Test duplicate point detection and prevention."""
 
-    @pytest.mark.unit
-    async def test_detect_duplicate_point_by_refname(self, mock_skyspark_client: MagicMock) -> None:
-        """Test detecting duplicate points by refName."""
-        ref_name = "temp-sensor-1"
-
-        existing_points = [
-            {"id": {"val": "p:aceTest:r:point-1"}, "refName": "temp-sensor-1"},
-            {"id": {"val": "p:aceTest:r:point-2"}, "refName": "humidity-sensor-1"},
-        ]
-        mock_skyspark_client.read_points.return_value = existing_points
-
-        points = await mock_skyspark_client.read_points()
-        duplicate = find_by_ref_name(points, ref_name)
-
-        assert duplicate is not None
-        assert duplicate["refName"] == ref_name
-
-    @pytest.mark.unit
-    async def test_prevent_duplicate_point_creation(self, mock_skyspark_client: MagicMock) -> None:
-        """Test preventing duplicate point creation."""
-        ref_name = "temp-sensor-1"
-
-        # Check for existing
-        existing_points = [{"id": {"val": "p:aceTest:r:point-1"}, "refName": ref_name}]
-        mock_skyspark_client.read.return_value = existing_points
-
-        existing = await mock_skyspark_client.read(f'point and refName=="{ref_name}"')
-
-        # Don't create if exists
-        if existing:
-            should_create = False
-            point_id = existing[0]["id"]["val"]
-        else:
-            should_create = True
-            point_id = None
-
-        assert should_create is False
-        assert point_id == "p:aceTest:r:point-1"
-
     @pytest.mark.unit
     async def test_batch_duplicate_detection(self, mock_skyspark_client: MagicMock) -> None:
         """Test detecting duplicates in batch operations."""
@@ -125,67 +109,21 @@ class TestDuplicatePointDetection:
         mock_skyspark_client.read_points.return_value = existing
 
         existing_points = await mock_skyspark_client.read_points()
-        existing_refnames = {p["refName"] for p in existing_points}
+        existing_by_refname = index_by_ref_name(existing_points)
 
         # Filter out duplicates
-        new_points = [p for p in points_to_sync if p["refName"] not in existing_refnames]
+        new_points = [p for p in points_to_sync if p["refName"] not in existing_by_refname]
 
         assert len(new_points) == 1
         assert new_points[0]["refName"] == "point-2"
-
-
-class TestDuplicateEquipmentDetection:
-    """Test duplicate equipment detection and prevention."""
-
-    @pytest.mark.unit
-    async def test_detect_duplicate_equipment_by_refname(
-        self, mock_skyspark_client: MagicMock
-    ) -> None:
-        """Test detecting duplicate equipment by refName."""
-        ref_name = "ahu-1"
-
-        existing_equipment = [
-            {"id": {"val": "p:aceTest:r:equip-1"}, "refName": "ahu-1"},
-            {"id": {"val": "p:aceTest:r:equip-2"}, "refName": "rtu-1"},
-        ]
-        mock_skyspark_client.read_equipment.return_value = existing_equipment
-
-        equipment = await mock_skyspark_client.read_equipment()
-        duplicate = find_by_ref_name(equipment, ref_name)
-
-        assert duplicate is not None
-        assert duplicate["refName"] == ref_name
-
-    @pytest.mark.unit
-    async def test_prevent_duplicate_equipment_creation(
-        self, mock_skyspark_client: MagicMock
-    ) -> None:
-        """Test preventing duplicate equipment creation."""
-        ref_name = "ahu-1"
-
-        # Check for existing
-        existing_equipment = [{"id": {"val": "p:aceTest:r:equip-1"}, "refName": ref_name}]
-        mock_skyspark_client.read.return_value = existing_equipment
-
-        existing = await mock_skyspark_client.read(f'equip and refName=="{ref_name}"')
-
-        # Don't create if exists
-        if existing:
-            should_create = False
-            equip_id = existing[0]["id"]["val"]
-        else:
-            should_create = True
-            equip_id = None
-
-        assert should_create is False
-        assert equip_id == "p:aceTest:r:equip-1"
+        assert existing_by_refname["point-3"]["id"]["val"] == "p:aceTest:r:point-3"
 
 
 class TestHaystackRefDuplicatePrevention:
     """Test duplicate prevention using haystackRef."""
 
     @pytest.mark.unit
-    async def test_haystack_ref_prevents_duplicate_sync(
+    def test_haystack_ref_prevents_duplicate_sync(
         self, sample_flightdeck_point_with_haystack_ref: Any
     ) -> None:
         """Test that existing haystackRef prevents duplicate sync."""
@@ -198,7 +136,7 @@ class TestHaystackRefDuplicatePrevention:
         assert should_sync is False
 
     @pytest.mark.unit
-    async def test_missing_haystack_ref_allows_sync(self, sample_flightdeck_point: Any) -> None:
+    def test_missing_haystack_ref_allows_sync(self, sample_flightdeck_point: Any) -> None:
         """Test that missing haystackRef allows sync."""
         # Point doesn't have haystackRef
         has_ref = "haystackRef" in (sample_flightdeck_point.kv_tags or {})
@@ -293,7 +231,7 @@ class TestCrossEntityDuplicates:
         assert duplicate_exists is True
 
     @pytest.mark.unit
-    async def test_allow_same_refname_different_equipment(
+    def test_allow_same_refname_different_equipment(
         self,
         mock_skyspark_client: MagicMock,  # noqa: ARG002
     ) -> None:
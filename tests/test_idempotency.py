@@ -1,9 +1,56 @@
 """Tests for idempotency verification."""
 
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import MagicMock
 
 import pytest
+from ace_skyspark_lib import Point
+
+from ace_skyspark_cli.sync import PointSyncService
+from tests.test_utils import make_config, marker_tag_names
+
+
+def stateful_sync_service(
+    mock_flightdeck_client: MagicMock,
+    mock_skyspark_client: MagicMock,
+    ace_points: list[dict[str, Any]],
+) -> PointSyncService:
+    """Build a sync service whose mock clients keep what earlier syncs wrote.
+
+    SkySpark reads return the site, its equipment and every point created so far;
+    refs stored back to ACE are merged into ``ace_points`` so the next sync sees them.
+    """
+    rows: list[dict[str, Any]] = [
+        {"id": {"val": "@site-1"}, "site": {"_kind": "marker"}, "refName": "ace-site-test-site"},
+        {
+            "id": {"val": "@equip-1"},
+            "equip": {"_kind": "marker"},
+            "refName": "ace-equip-10-1",
+            "siteRef": {"val": "@site-1"},
+        },
+    ]
+
+    def create_points(points: list[Point]) -> list[dict[str, Any]]:
+        created = []
+        for point in points:
+            point_id = f"pt-{len(rows) + len(created)}"
+            created.append({**point.model_dump(), "id": f"@{point_id}", "haystackRef": point_id})
+        rows.extend(created)
+        return created
+
+    def store_refs(points: list[dict[str, Any]], *_flags: bool) -> dict[str, Any]:
+        by_name = {point["name"]: point for point in ace_points}
+        for point in points:
+            by_name[point["name"]]["kv_tags"].update(point["kv_tags"])
+        return {}
+
+    mock_skyspark_client.read.side_effect = lambda _filter: list(rows)
+    mock_skyspark_client.create_points.side_effect = create_points
+    mock_flightdeck_client.get_site_configured_points = MagicMock(
+        side_effect=lambda *_args, **_kwargs: {"items": ace_points}
+    )
+    mock_flightdeck_client.create_points.side_effect = store_refs
+    return PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
 
 
 class TestIdempotentSiteCreation:
@@ -65,32 +112,34 @@ class TestIdempotentPointCreation:
     @pytest.mark.unit
     @pytest.mark.idempotent
     async def test_create_point_with_refname_idempotent(
-        self, mock_skyspark_client: MagicMock
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
     ) -> None:
         """Test that points with same refName are not duplicated."""
-        ref_name = "temp-sensor-001"
-
-        # First attempt: no existing point
-        mock_skyspark_client.read.return_value = []
-        existing = await mock_skyspark_client.read(f'point and refName=="{ref_name}"')
-        assert len(existing) == 0
+        ace_point = {
+            "id": 7,
+            "name": "client/test-site/temp-sensor-001",
+            "client": "client",
+            "site": "test-site",
+            "kv_tags": {},
+            "bacnet_data": {"device_address": "10", "device_id": 1},
+        }
+        service = stateful_sync_service(mock_flightdeck_client, mock_skyspark_client, [ace_point])
 
-        # Create point
-        mock_skyspark_client.create_points.return_value = [
-            {"id": {"val": "p:aceTest:r:point-123"}, "refName": ref_name}
-        ]
-        created = await mock_skyspark_client.create_points([])
-        point_id = created[0]["id"]["val"]
+        # First sync: no existing point, so it is created under the ACE-derived refName
+        await service.sync_points_for_site("test-site")
+        (created,) = mock_skyspark_client.create_points.call_args.args[0]
+        assert created.ref_name == "ace-point-7"
 
-        # Second attempt: point exists
-        mock_skyspark_client.read.return_value = [{"id": {"val": point_id}, "refName": ref_name}]
-        existing2 = await mock_skyspark_client.read(f'point and refName=="{ref_name}"')
-        assert len(existing2) == 1
-        assert existing2[0]["id"]["val"] == point_id
+        # Second sync: the point is found through its stored ref instead of recreated
+        result = await service.sync_points_for_site("test-site")
+        assert result.points_created == 0
+        assert result.points_skipped == 1
+        mock_skyspark_client.create_points.assert_awaited_once()
+        mock_skyspark_client.update_points.assert_not_called()
 
     @pytest.mark.unit
     @pytest.mark.idempotent
-    async def test_haystack_ref_ensures_idempotency(
+    def test_haystack_ref_ensures_idempotency(
         self, sample_flightdeck_point_with_haystack_ref: Any
     ) -> None:
         """Test that haystackRef tag ensures idempotent operations."""
@@ -140,9 +189,7 @@ class TestIdempotentTagSynchronization:
         ]
 
         existing = await mock_skyspark_client.read(f"id==@{point_id}")
-        initial_tags = {
-            k for k, v in existing[0].items() if isinstance(v, dict) and v.get("_kind") == "marker"
-        }
+        initial_tags = marker_tag_names(existing[0])
 
         # Add "sensor" tag again (already exists)
         mock_skyspark_client.update_points.return_value = [
@@ -161,9 +208,7 @@ class TestIdempotentTagSynchronization:
             }
         ]
         after = await mock_skyspark_client.read(f"id==@{point_id}")
-        after_tags = {
-            k for k, v in after[0].items() if isinstance(v, dict) and v.get("_kind") == "marker"
-        }
+        after_tags = marker_tag_names(after[0])
 
         assert initial_tags == after_tags
 
@@ -179,7 +224,6 @@ class TestIdempotentHaystackRefUpdate:
         skyspark_id = "p:aceTest:r:point-123"
 
         # First update
-        mock_flightdeck_client.update_point = AsyncMock()
         await mock_flightdeck_client.update_point(point_id, tags={"haystackRef": skyspark_id})
 
         # Second update (same value)
@@ -190,7 +234,7 @@ class TestIdempotentHaystackRefUpdate:
 
     @pytest.mark.unit
     @pytest.mark.idempotent
-    async def test_skip_update_if_haystack_ref_unchanged(
+    def test_skip_update_if_haystack_ref_unchanged(
         self, sample_flightdeck_point_with_haystack_ref: Any
     ) -> None:
         """Test that updates are skipped if haystackRef is already correct."""
@@ -209,63 +253,59 @@ class TestIdempotentFullSync:
     @pytest.mark.unit
     @pytest.mark.idempotent
     async def test_sync_twice_produces_same_result(
-        self,
-        mock_flightdeck_client: MagicMock,
-        mock_skyspark_client: MagicMock,
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
     ) -> None:
         """Test that running sync twice doesn't create duplicates."""
-        # Mock FlightDeck points
-        fd_points = [
-            {"id": "fd-1", "name": "Point 1", "tags": {}},
-            {"id": "fd-2", "name": "Point 2", "tags": {}},
-        ]
-        mock_flightdeck_client.get_points.return_value = fd_points
-
-        # First sync: create points
-        mock_skyspark_client.read.return_value = []
-        mock_skyspark_client.create_points.return_value = [
-            {"id": {"val": "p:aceTest:r:point-1"}},
-            {"id": {"val": "p:aceTest:r:point-2"}},
+        ace_points: list[dict[str, Any]] = [
+            {
+                "id": i,
+                "name": f"client/test-site/point-{i}",
+                "client": "client",
+                "site": "test-site",
+                "kv_tags": {},
+                "bacnet_data": {"device_address": "10", "device_id": 1},
+            }
+            for i in (1, 2)
         ]
+        service = stateful_sync_service(mock_flightdeck_client, mock_skyspark_client, ace_points)
 
-        created_first = await mock_skyspark_client.create_points([])
-        first_sync_count = len(created_first)
+        # First sync: points don't exist yet, so both are created
+        first = await service.sync_points_for_site("test-site")
+        first_refs = [p["kv_tags"]["haystackRef"] for p in ace_points]
 
         # Second sync: points exist, no duplicates
-        mock_skyspark_client.read.return_value = [
-            {"id": {"val": "p:aceTest:r:point-1"}, "refName": "fd-1"},
-            {"id": {"val": "p:aceTest:r:point-2"}, "refName": "fd-2"},
-        ]
-        mock_skyspark_client.create_points.return_value = []
-
-        created_second = await mock_skyspark_client.create_points([])
-        second_sync_count = len(created_second)
+        second = await service.sync_points_for_site("test-site")
 
-        # Second sync should create nothing
-        assert first_sync_count == 2
-        assert second_sync_count == 0
+        assert first.points_created == 2
+        assert second.points_created == 0
+        assert second.points_skipped == 2
+        mock_skyspark_client.create_points.assert_awaited_once()
+        mock_skyspark_client.update_points.assert_not_called()
+        assert [p["kv_tags"]["haystackRef"] for p in ace_points] == first_refs
 
     @pytest.mark.unit
     @pytest.mark.idempotent
-    async def test_interrupted_sync_can_resume(
+    def test_interrupted_sync_can_resume(
         self,
         mock_flightdeck_client: MagicMock,  # noqa: ARG002
         mock_skyspark_client: MagicMock,  # noqa: ARG002
     ) -> None:
         """Test that interrupted sync can resume without duplicates."""
-        # Scenario: 5 points, first 3 synced before interruption
-        [{"id": f"fd-{i}", "name": f"Point {i}"} for i in range(5)]
-
-        # Already synced (have haystackRef)
-
-        # Not yet synced
-        unsynced_points = [
-            {"id": "fd-3", "name": "Point 3", "tags": {}},
-            {"id": "fd-4", "name": "Point 4", "tags": {}},
+        # Scenario: 5 points, first 3 synced (given a haystackRef) before interruption
+        all_points = [
+            {
+                "id": f"fd-{i}",
+                "name": f"Point {i}",
+                "tags": {"haystackRef": f"p:aceTest:r:point-{i}"} if i < 3 else {},
+            }
+            for i in range(5)
         ]
 
+        # Index the synced points once so the resume filter is a set lookup per point
+        synced_ids = frozenset(p["id"] for p in all_points if "haystackRef" in p["tags"])
+
         # Resume: only unsynced points should be processed
-        points_to_sync = [p for p in unsynced_points if "haystackRef" not in p["tags"]]
+        points_to_sync = [p for p in all_points if p["id"] not in synced_ids]
 
         assert len(points_to_sync) == 2
         assert points_to_sync[0]["id"] == "fd-3"
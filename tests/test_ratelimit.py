@@ -0,0 +1,89 @@
+"""Tests for the async token-bucket rate limiter."""
+
+import asyncio
+
+import pytest
+
+from ace_skyspark_cli import ratelimit
+from ace_skyspark_cli.ratelimit import AsyncTokenBucket
+
+
+class FakeClock:
+    """Stand-in for time.monotonic and asyncio.sleep that records requested waits."""
+
+    def __init__(self) -> None:
+        """Start the clock at zero with no recorded sleeps."""
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        """Record the wait and advance the clock instead of sleeping."""
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Drive the limiter from a fake clock so waits are computed, not measured."""
+    fake = FakeClock()
+    monkeypatch.setattr(ratelimit, "time", fake)
+    monkeypatch.setattr(asyncio, "sleep", fake.sleep)
+    return fake
+
+
+class TestAsyncTokenBucket:
+    """Test AsyncTokenBucket behavior."""
+
+    @pytest.mark.unit
+    def test_rejects_non_positive_rate(self) -> None:
+        """Test a zero rate is rejected."""
+        with pytest.raises(ValueError, match="rate must be positive"):
+            AsyncTokenBucket(0)
+
+    @pytest.mark.unit
+    async def test_burst_up_to_capacity_is_immediate(self, clock: FakeClock) -> None:
+        """Test acquiring up to capacity does not wait."""
+        limiter = AsyncTokenBucket(rate=10)
+
+        for _ in range(10):
+            await limiter.acquire()
+
+        assert clock.sleeps == []
+
+    @pytest.mark.unit
+    async def test_waits_for_refill_when_empty(self, clock: FakeClock) -> None:
+        """Test acquiring past capacity waits exactly one token's refill time."""
+        limiter = AsyncTokenBucket(rate=20, capacity=1)
+
+        async with limiter:
+            pass
+        async with limiter:
+            pass
+
+        assert clock.sleeps == [pytest.approx(0.05)]
+
+    @pytest.mark.unit
+    async def test_wait_accounts_for_partial_refill(self, clock: FakeClock) -> None:
+        """Test time elapsed since the last acquire shortens the wait."""
+        limiter = AsyncTokenBucket(rate=10, capacity=1)
+
+        await limiter.acquire()
+        clock.now += 0.04
+        await limiter.acquire()
+
+        assert clock.sleeps == [pytest.approx(0.06)]
+
+    @pytest.mark.unit
+    async def test_idle_refill_is_capped_at_capacity(self, clock: FakeClock) -> None:
+        """Test a long idle period does not allow a burst beyond capacity."""
+        limiter = AsyncTokenBucket(rate=10, capacity=2)
+
+        clock.now += 60
+        for _ in range(3):
+            await limiter.acquire()
+
+        assert clock.sleeps == [pytest.approx(0.1)]
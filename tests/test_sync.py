@@ -1,13 +1,14 @@
 """Tests for synchronization service with idempotency."""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from ace_skyspark_lib import Point
+from aceiot_models.api import APIError
 from aceiot_models.points import Point as ACEPoint
 
-from ace_skyspark_cli.config import Config
-from ace_skyspark_cli.sync import PointSyncService, SyncResult
+from ace_skyspark_cli.sync import PointSyncService, SyncResult, _ref_value
+from tests.test_utils import make_config
 
 
 class TestSyncResult:
@@ -56,8 +57,7 @@ class TestPointSyncService:
         self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
     ) -> None:
         """Test building ref map with empty list."""
-        config = MagicMock(spec=Config)
-        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, config)
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
 
         ref_map = service._build_ref_map([])
         assert ref_map == {}
@@ -67,8 +67,7 @@ class TestPointSyncService:
         self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
     ) -> None:
         """Test building ref map with points containing haystackRef."""
-        config = MagicMock(spec=Config)
-        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, config)
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
 
         skyspark_points = [
             {
@@ -94,13 +93,27 @@ class TestPointSyncService:
         assert "ace-point-2" in ref_map
         assert ref_map["ace-point-1"]["dis"] == "Point 1"
 
+    @pytest.mark.unit
+    def test_build_ref_map_unwraps_zinc_refs(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test Zinc-format haystackRef values are unwrapped and empty ones skipped."""
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
+
+        ref_map = service._build_ref_map(
+            [
+                {"dis": "Zinc", "haystackRef": {"val": "ace-point-4"}},
+                {"dis": "Empty", "haystackRef": {"val": ""}},
+            ]
+        )
+        assert list(ref_map) == ["ace-point-4"]
+
     @pytest.mark.unit
     def test_get_haystack_ref_none(
         self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
     ) -> None:
         """Test getting haystackRef when none exists."""
-        config = MagicMock(spec=Config)
-        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, config)
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
 
         ace_point = ACEPoint(
             name="Test Point",
@@ -117,8 +130,7 @@ class TestPointSyncService:
         self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
     ) -> None:
         """Test getting haystackRef when it exists."""
-        config = MagicMock(spec=Config)
-        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, config)
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
 
         ace_point = ACEPoint(
             name="Test Point",
@@ -135,8 +147,7 @@ class TestPointSyncService:
         self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
     ) -> None:
         """Test preparing a point for creation."""
-        config = MagicMock(spec=Config)
-        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, config)
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
 
         ace_point = ACEPoint(
             name="Temperature Sensor",
@@ -156,13 +167,54 @@ class TestPointSyncService:
         assert "sensor" in sky_point.marker_tags
         assert "temp" in sky_point.marker_tags
 
+    @pytest.mark.unit
+    async def test_invalid_skyspark_point_is_reported_per_point(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test a SkySpark point that fails validation only fails that ACE point."""
+        mock_skyspark_client.read.return_value = [
+            {
+                "id": {"val": "@site-1"},
+                "site": {"_kind": "marker"},
+                "refName": "ace-site-test-site",
+            },
+            {
+                "id": {"val": "@pt-1"},
+                "point": {"_kind": "marker"},
+                "haystackRef": "pt-1",
+                "refName": "ace-point-1",
+                "kind": "Bogus",
+            },
+        ]
+        mock_skyspark_client.create_points.return_value = [{"id": {"val": "@pt-2"}}]
+        mock_flightdeck_client.get_site_configured_points = MagicMock(
+            return_value={
+                "items": [
+                    {
+                        "name": "client/test-site/p1",
+                        "client": "client",
+                        "site": "test-site",
+                        "kv_tags": {"haystackRef": "pt-1"},
+                    },
+                    {"name": "client/test-site/p2", "client": "client", "site": "test-site"},
+                ]
+            }
+        )
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
+
+        result = await service.sync_points_for_site("test-site")
+
+        assert result.points_created == 1
+        assert result.points_updated == 0
+        assert len(result.errors) == 1
+        assert "client/test-site/p1" in result.errors[0]
+
     @pytest.mark.unit
     def test_prepare_point_update(
         self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
     ) -> None:
         """Test preparing a point for update."""
-        config = MagicMock(spec=Config)
-        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, config)
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
 
         ace_point = ACEPoint(
             name="Temperature Sensor Updated",
@@ -193,13 +245,10 @@ class TestPointSyncService:
         self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
     ) -> None:
         """Test creating empty batch of points."""
-        config = MagicMock(spec=Config)
-        config.app = MagicMock()
-        config.app.batch_size = 100
-        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, config)
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
 
-        result = await service._create_points_batch([])
-        assert result == []
+        result = await service._create_points_batch_resilient([], [], "UTC")
+        assert result == (0, 0)
         mock_skyspark_client.create_points.assert_not_called()
 
     @pytest.mark.unit
@@ -208,10 +257,7 @@ class TestPointSyncService:
         self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
     ) -> None:
         """Test creating single batch of points."""
-        config = MagicMock(spec=Config)
-        config.app = MagicMock()
-        config.app.batch_size = 100
-        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, config)
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
 
         point = Point(
             dis="Test Point",
@@ -222,9 +268,10 @@ class TestPointSyncService:
             marker_tags=["sensor"],  # Need at least one function marker
         )
         mock_skyspark_client.create_points.return_value = [{"id": {"val": "@test-1"}}]
+        service._store_refs_to_ace = AsyncMock()  # type: ignore[method-assign]
 
-        result = await service._create_points_batch([point])
-        assert len(result) == 1
+        result = await service._create_points_batch_resilient([point], [{"name": "p"}], "UTC")
+        assert result == (1, 0)
         mock_skyspark_client.create_points.assert_called_once()
 
     @pytest.mark.unit
@@ -233,10 +280,7 @@ class TestPointSyncService:
         self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
     ) -> None:
         """Test updating batch of points."""
-        config = MagicMock(spec=Config)
-        config.app = MagicMock()
-        config.app.batch_size = 100
-        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, config)
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
 
         point = Point(
             id="test-1",
@@ -251,10 +295,331 @@ class TestPointSyncService:
             {"id": {"val": "@test-1"}, "dis": "Test Point"}
         ]
 
-        result = await service._update_points_batch([point])
-        assert len(result) == 1
+        service._store_refs_to_ace = AsyncMock()  # type: ignore[method-assign]
+
+        result = await service._update_points_batch_resilient([point], [{"name": "p"}], "UTC")
+        assert result == (1, 0)
         mock_skyspark_client.update_points.assert_called_once()
 
+    @pytest.mark.unit
+    async def test_store_refs_uses_async_ace_client(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test ref storage awaits the async ACE client instead of the executor."""
+        config = make_config()
+        ace_async_client = MagicMock()
+        ace_async_client.create_points = AsyncMock(return_value={})
+        service = PointSyncService(
+            mock_flightdeck_client,
+            mock_skyspark_client,
+            config,
+            ace_async_client=ace_async_client,
+        )
+
+        ace_points = [{"name": "site/point-1", "client": "c", "site": "s", "kv_tags": {}}]
+        sky_points = [
+            {
+                "id": {"val": "@sky-1"},
+                "siteRef": {"val": "@site-1"},
+                "equipRef": {"val": "@equip-1"},
+            }
+        ]
+
+        await service._store_refs_to_ace(ace_points, sky_points, "America/New_York")
+
+        ace_async_client.create_points.assert_awaited_once()
+        sent = ace_async_client.create_points.call_args.args[0]
+        assert sent[0]["kv_tags"]["haystackRef"] == "sky-1"
+        assert sent[0]["kv_tags"]["haystack_equipRef"] == "equip-1"
+        mock_flightdeck_client.create_points.assert_not_called()
+
+    @pytest.mark.unit
+    async def test_store_refs_falls_back_to_sync_client(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test ref storage uses the sync ACE client when no async client is given."""
+        config = make_config()
+        ace_points = [{"name": "site/point-1", "client": "c", "site": "s", "kv_tags": {}}]
+        sky_points = [{"id": {"val": "@sky-1"}}]
+
+        async with PointSyncService(
+            mock_flightdeck_client, mock_skyspark_client, config
+        ) as service:
+            await service._store_refs_to_ace(ace_points, sky_points)
+            assert service._ace_executor is not None
+
+        # Leaving the context releases the service's ACE worker threads
+        assert service._ace_executor is None
+        mock_flightdeck_client.create_points.assert_called_once()
+        assert mock_flightdeck_client.create_points.call_args.args[1:] == (False, False)
+
+    @pytest.mark.unit
+    async def test_store_refs_skips_points_without_id(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test ref storage drops SkySpark points that came back without an id."""
+        config = make_config()
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, config)
+
+        ace_points = [
+            {"name": f"site/point-{i}", "client": "c", "site": "s", "kv_tags": {"a": "1"}}
+            for i in range(2)
+        ]
+        sky_points = [{"id": {}}, {"id": "@sky-2", "siteRef": "@site-1"}]
+
+        await service._store_refs_to_ace(ace_points, sky_points)
+
+        sent = mock_flightdeck_client.create_points.call_args.args[0]
+        assert [p["name"] for p in sent] == ["site/point-1"]
+        assert sent[0]["kv_tags"] == {
+            "a": "1",
+            "haystackRef": "sky-2",
+            "haystack_siteRef": "site-1",
+            "haystack_equipRef": "",
+            "tz": "UTC",
+            "skysparkTz": "UTC",
+        }
+
+    @pytest.mark.unit
+    async def test_store_refs_joins_results_by_ace_topic(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test reordered or partial SkySpark results attach refs to the right ACE point."""
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
+        ace_points = [
+            {"name": f"site/point-{i}", "client": "c", "site": "s", "kv_tags": {}} for i in range(3)
+        ]
+        sky_points = [
+            {"id": "@sky-2", "ace_topic": "site/point-2"},
+            {"id": "@sky-0", "ace_topic": "site/point-0"},
+            {"id": "@sky-x", "ace_topic": "site/unknown"},
+        ]
+
+        await service._store_refs_to_ace(ace_points, sky_points)
+
+        sent = mock_flightdeck_client.create_points.call_args.args[0]
+        assert {p["name"]: p["kv_tags"]["haystackRef"] for p in sent} == {
+            "site/point-2": "sky-2",
+            "site/point-0": "sky-0",
+        }
+
+    @pytest.mark.unit
+    async def test_store_refs_joins_on_overridden_ace_topic(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test an ace_topic kv tag in ACE, not the point name, is the join key."""
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
+        ace_points = [
+            {"name": "site/point-0", "client": "c", "site": "s", "kv_tags": {}},
+            {"name": "site/point-1", "client": "c", "site": "s", "kv_tags": {"ace_topic": "t1"}},
+        ]
+        sky_points = [{"id": "@sky-1", "ace_topic": "t1"}]
+
+        await service._store_refs_to_ace(ace_points, sky_points)
+
+        (stored,) = mock_flightdeck_client.create_points.call_args.args[0]
+        assert stored["name"] == "site/point-1"
+        assert stored["kv_tags"]["haystackRef"] == "sky-1"
+
+    @pytest.mark.unit
+    async def test_store_refs_falls_back_to_order_only_for_full_results(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test results without ace_topic are matched by position only when none are missing."""
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
+        ace_points = [
+            {"name": f"site/point-{i}", "client": "c", "site": "s", "kv_tags": {}} for i in range(2)
+        ]
+
+        await service._store_refs_to_ace(ace_points, [{"id": "@sky-1"}])
+        mock_flightdeck_client.create_points.assert_not_called()
+
+        await service._store_refs_to_ace(ace_points, [{"id": "@sky-0"}, {"id": "@sky-1"}])
+        sent = mock_flightdeck_client.create_points.call_args.args[0]
+        assert [p["kv_tags"]["haystackRef"] for p in sent] == ["sky-0", "sky-1"]
+
+    @pytest.mark.unit
+    async def test_store_refs_batched_sends_one_request_per_batch(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test stale-ref refreshes are chunked by batch_size and failures are counted."""
+        service = PointSyncService(
+            mock_flightdeck_client, mock_skyspark_client, make_config(batch_size=2)
+        )
+        ace_points = [
+            {"name": f"site/point-{i}", "client": "c", "site": "s", "kv_tags": {}} for i in range(5)
+        ]
+        sky_points = [{"id": f"@sky-{i}", "ace_topic": f"site/point-{i}"} for i in range(5)]
+
+        def create_points(batch: list[dict], *_flags: bool) -> dict:
+            if batch[0]["name"] == "site/point-2":
+                raise RuntimeError("boom")
+            return {}
+
+        mock_flightdeck_client.create_points.side_effect = create_points
+
+        result = await service._store_refs_batched(ace_points, sky_points, "UTC")
+
+        assert result == (3, 2)
+        sizes = sorted(len(c.args[0]) for c in mock_flightdeck_client.create_points.call_args_list)
+        assert sizes == [1, 2, 2]
+
+    @pytest.mark.unit
+    async def test_empty_batches_make_no_requests(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test empty create/update batches and ref stores short-circuit."""
+        config = make_config()
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, config)
+
+        assert await service._create_points_batch_resilient([], [], "UTC") == (0, 0)
+        assert await service._update_points_batch_resilient([], [], "UTC") == (0, 0)
+        assert await service._store_refs_batched([], [], "UTC") == (0, 0)
+        await service._store_refs_to_ace([{"name": "p"}], [])
+
+        mock_skyspark_client.create_points.assert_not_called()
+        mock_skyspark_client.update_points.assert_not_called()
+        mock_flightdeck_client.create_points.assert_not_called()
+
+    @pytest.mark.unit
+    async def test_create_batches_continue_past_failed_batch(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test a failing batch is counted without stopping the remaining batches."""
+        config = make_config(batch_size=1)
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, config)
+        service._store_refs_to_ace = AsyncMock()  # type: ignore[method-assign]
+
+        async def create_points(batch: list[Point]) -> list[dict[str, str]]:
+            if batch[0].dis == "bad":
+                raise RuntimeError("boom")
+            return [{"id": f"@{batch[0].dis}"}]
+
+        mock_skyspark_client.create_points = AsyncMock(side_effect=create_points)
+        points = [
+            Point(
+                dis=name,
+                refName=name,
+                siteRef="s1",
+                equipRef="e1",
+                kind="Number",
+                marker_tags=["sensor"],
+            )
+            for name in ("a", "bad", "c")
+        ]
+
+        result = await service._create_points_batch_resilient(
+            points, [{"name": p.dis} for p in points], "UTC"
+        )
+
+        assert result == (2, 1)
+        assert mock_skyspark_client.create_points.await_count == 3
+        assert service._store_refs_to_ace.await_count == 2
+
+    @pytest.mark.unit
+    async def test_collect_ace_points_merges_pages_in_order(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test remaining pages are fetched concurrently and merged by page number."""
+        config = make_config(max_concurrent=2)
+
+        def get_page(_site: str, page: int, _per_page: int) -> dict:
+            if page == 3:
+                raise RuntimeError("500 Internal Server Error")
+            return {"items": [{"name": f"p{page}"}], "pages": 4}
+
+        mock_flightdeck_client.get_site_configured_points = MagicMock(side_effect=get_page)
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, config)
+
+        points, total = await service._collect_ace_points("test-site", True, None)
+
+        assert [p["name"] for p in points] == ["p1", "p2", "p4"]
+        assert total == 3
+        assert mock_flightdeck_client.get_site_configured_points.call_count == 4
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("limit", [None, 2])
+    async def test_collect_ace_points_drops_duplicates_across_pages(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock, limit: int | None
+    ) -> None:
+        """Test a point repeated by overlapping pages is kept once."""
+        pages = {1: ["p2", "p1"], 2: ["p1", "p3"]}
+
+        def get_page(_site: str, page: int, _per_page: int) -> dict:
+            return {"items": [{"name": n, "page": page} for n in pages[page]], "pages": 2}
+
+        mock_flightdeck_client.get_site_configured_points = MagicMock(side_effect=get_page)
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
+
+        points, total = await service._collect_ace_points("test-site", True, limit)
+
+        assert [(p["name"], p["page"]) for p in points] == [("p1", 1), ("p2", 1), ("p3", 2)][:limit]
+        assert total == 3
+
+    @pytest.mark.unit
+    async def test_collect_ace_points_uses_async_ace_client(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test ACE reads are awaited on the async client when one is provided."""
+        config = make_config()
+        ace_async_client = MagicMock()
+        ace_async_client.get_site_points = AsyncMock(
+            return_value={"items": [{"name": "p1"}], "pages": 1}
+        )
+        service = PointSyncService(
+            mock_flightdeck_client,
+            mock_skyspark_client,
+            config,
+            ace_async_client=ace_async_client,
+        )
+
+        points, _ = await service._collect_ace_points("test-site", False, None)
+
+        assert points == [{"name": "p1"}]
+        ace_async_client.get_site_points.assert_awaited_once_with("test-site", 1, 500)
+        mock_flightdeck_client.get_site_points.assert_not_called()
+
+    @pytest.mark.unit
+    async def test_call_ace_retries_rate_limited_requests(
+        self,
+        mock_flightdeck_client: MagicMock,
+        mock_skyspark_client: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test async ACE calls retry 429s with backoff and then succeed."""
+        monkeypatch.setattr("ace_skyspark_cli.sync.random.uniform", lambda _a, _b: 0.0)
+        ace_async_client = MagicMock()
+        ace_async_client.get_site = AsyncMock(
+            side_effect=[APIError("rate limited", status_code=429), {"name": "site"}]
+        )
+        service = PointSyncService(
+            mock_flightdeck_client,
+            mock_skyspark_client,
+            make_config(ace_max_retries=2),
+            ace_async_client=ace_async_client,
+        )
+
+        assert await service._call_ace("get_site", "site") == {"name": "site"}
+        assert ace_async_client.get_site.await_count == 2
+
+    @pytest.mark.unit
+    async def test_call_ace_does_not_retry_client_errors(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test async ACE calls surface non-retryable errors immediately."""
+        ace_async_client = MagicMock()
+        ace_async_client.get_site = AsyncMock(side_effect=APIError("missing", status_code=404))
+        service = PointSyncService(
+            mock_flightdeck_client,
+            mock_skyspark_client,
+            make_config(ace_max_retries=3),
+            ace_async_client=ace_async_client,
+        )
+
+        with pytest.raises(APIError):
+            await service._call_ace("get_site", "site")
+        assert ace_async_client.get_site.await_count == 1
+
 
 class TestIdempotency:
     """Test idempotency behavior of sync operations."""
@@ -264,8 +629,7 @@ class TestIdempotency:
         self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
     ) -> None:
         """Test haystackRef tag is defined as constant."""
-        config = MagicMock(spec=Config)
-        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, config)
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
         assert service.HAYSTACK_REF_TAG == "haystackRef"
 
     @pytest.mark.idempotent
@@ -274,8 +638,7 @@ class TestIdempotency:
         self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
     ) -> None:
         """Test that points with haystackRef are identified for update, not create."""
-        config = MagicMock(spec=Config)
-        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, config)
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
 
         # Point with haystackRef should match existing SkySpark point
         ace_point = ACEPoint(
@@ -299,3 +662,384 @@ class TestIdempotency:
         # Should find match in ref_map
         assert haystack_ref in ref_map
         assert ref_map[haystack_ref]["id"]["val"] == "@sky-123"
+
+
+class TestSyncPointsForSite:
+    """Test the end-to-end sync flow against mocked clients."""
+
+    @staticmethod
+    def _ace_point(name: str, haystack_ref: str | None = None) -> dict:
+        return {
+            "name": f"client/test-site/{name}",
+            "client": "client",
+            "site": "test-site",
+            "marker_tags": ["sensor"],
+            "kv_tags": {"haystackRef": haystack_ref} if haystack_ref else {},
+            "bacnet_data": {"device_address": "10", "device_id": 1, "object_name": name},
+        }
+
+    @pytest.mark.unit
+    async def test_sync_reads_skyspark_entities_once(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test sites, equipment and points come from a single SkySpark read."""
+        mock_skyspark_client.read.return_value = [
+            {
+                "id": {"val": "@site-1"},
+                "site": {"_kind": "marker"},
+                "refName": "ace-site-test-site",
+                "tz": "New_York",
+            },
+            {
+                "id": {"val": "@equip-1"},
+                "equip": {"_kind": "marker"},
+                "refName": "ace-equip-10-1",
+                "siteRef": {"val": "@site-1"},
+            },
+            {
+                "id": {"val": "@pt-1"},
+                "point": {"_kind": "marker"},
+                "haystackRef": "pt-1",
+                "siteRef": {"val": "@site-1"},
+                "equipRef": {"val": "@equip-1"},
+            },
+        ]
+        mock_skyspark_client.create_points.return_value = [
+            {"id": {"val": "@pt-2"}, "siteRef": {"val": "@site-1"}}
+        ]
+        mock_skyspark_client.update_points.return_value = [{"id": {"val": "@pt-1"}}]
+        mock_flightdeck_client.get_site_configured_points = MagicMock(
+            return_value={"items": [self._ace_point("p2"), self._ace_point("p1", "pt-1")]}
+        )
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
+
+        result = await service.sync_points_for_site("test-site")
+
+        assert result.errors == []
+        assert result.sites_skipped == 1
+        assert result.equipment_skipped == 1
+        assert result.points_created == 1
+        assert result.points_updated == 1
+        mock_skyspark_client.read.assert_awaited_once_with(
+            "site or equip or (point and haystackRef)"
+        )
+        mock_skyspark_client.read_sites.assert_not_called()
+        mock_skyspark_client.read_equipment.assert_not_called()
+        mock_skyspark_client.read_points.assert_not_called()
+
+    @pytest.mark.unit
+    async def test_sync_falls_back_when_bulk_read_fails(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test a failed bulk read falls back to the per-type reads."""
+        mock_skyspark_client.read.side_effect = RuntimeError("boom")
+        mock_skyspark_client.read_sites.return_value = [
+            {"id": {"val": "@site-1"}, "refName": "ace-site-test-site", "tz": "UTC"}
+        ]
+        mock_flightdeck_client.get_site_configured_points = MagicMock(return_value={"items": []})
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
+
+        result = await service.sync_points_for_site("test-site")
+
+        assert result.sites_skipped == 1
+        mock_skyspark_client.read_sites.assert_awaited_once()
+
+    @pytest.mark.unit
+    async def test_sync_limit_keeps_first_names_across_pages(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test a limited sync keeps the lowest-sorting names from all pages."""
+        mock_skyspark_client.read.return_value = [
+            {"id": {"val": "@site-1"}, "site": {"_kind": "marker"}, "refName": "ace-site-test-site"}
+        ]
+        pages = {1: ["p5", "p3"], 2: ["p4", "p1"], 3: ["p2", "p6"]}
+
+        def get_page(_site: str, page: int, _per_page: int) -> dict:
+            return {"items": [self._ace_point(n) for n in pages[page]], "pages": 3}
+
+        mock_flightdeck_client.get_site_configured_points = MagicMock(side_effect=get_page)
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
+        service._prepare_point_create = MagicMock(  # type: ignore[method-assign]
+            side_effect=lambda ace_point, *_: ace_point["name"]
+        )
+
+        await service.sync_points_for_site("test-site", dry_run=True, limit=3)
+
+        prepared = [
+            c.args[0]["name"].rsplit("/", 1)[-1]
+            for c in service._prepare_point_create.call_args_list
+        ]
+        assert prepared == ["p1", "p2", "p3"]
+
+    def _unchanged_point_setup(
+        self,
+        mock_flightdeck_client: MagicMock,
+        mock_skyspark_client: MagicMock,
+        ace_point: dict,
+    ) -> tuple[PointSyncService, list[dict]]:
+        """Sync once, then make SkySpark return exactly what that sync sent."""
+        rows = [
+            {
+                "id": {"val": "@site-1"},
+                "site": {"_kind": "marker"},
+                "refName": "ace-site-test-site",
+            },
+            {
+                "id": {"val": "@equip-1"},
+                "equip": {"_kind": "marker"},
+                "refName": "ace-equip-10-1",
+                "siteRef": {"val": "@site-1"},
+            },
+            {
+                "id": {"val": "@pt-1"},
+                "point": {"_kind": "marker"},
+                "haystackRef": "pt-1",
+                "refName": "ace-point-1",
+                "siteRef": {"val": "@site-1"},
+            },
+        ]
+        mock_skyspark_client.read.return_value = rows
+        mock_skyspark_client.update_points.return_value = [{"id": {"val": "@pt-1"}}]
+        mock_flightdeck_client.get_site_configured_points = MagicMock(
+            return_value={"items": [ace_point]}
+        )
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
+        return service, rows
+
+    @pytest.mark.unit
+    async def test_unchanged_points_skip_update(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test a point SkySpark already holds is not sent again, but stale ACE refs are."""
+        service, rows = self._unchanged_point_setup(
+            mock_flightdeck_client, mock_skyspark_client, self._ace_point("p1", "pt-1")
+        )
+        first = await service.sync_points_for_site("test-site")
+        assert first.points_updated == 1
+        sent = mock_skyspark_client.update_points.call_args.args[0][0]
+
+        rows[2] = {**sent.model_dump(), "haystackRef": "pt-1", "mod": "t:2024-01-01T00:00:00Z"}
+        mock_skyspark_client.update_points.reset_mock()
+        mock_flightdeck_client.create_points.reset_mock()
+        second = await service.sync_points_for_site("test-site")
+
+        assert second.points_skipped == 1
+        assert second.points_updated == 0
+        mock_skyspark_client.update_points.assert_not_called()
+        # The ACE point has no site/equip refs yet, so they are stored anyway
+        stored = mock_flightdeck_client.create_points.call_args.args[0]
+        assert stored[0]["kv_tags"]["haystack_siteRef"] == "site-1"
+        assert stored[0]["kv_tags"]["haystack_equipRef"] == "equip-1"
+
+    @pytest.mark.unit
+    async def test_unchanged_points_with_current_ace_refs_skip_ref_store(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test nothing is written when SkySpark and the ACE refs are both current."""
+        ace_point = self._ace_point("p1", "pt-1")
+        ace_point["kv_tags"].update(
+            {
+                "haystack_siteRef": "site-1",
+                "haystack_equipRef": "equip-1",
+                "tz": "UTC",
+                "skysparkTz": "UTC",
+            }
+        )
+        service, rows = self._unchanged_point_setup(
+            mock_flightdeck_client, mock_skyspark_client, ace_point
+        )
+        await service.sync_points_for_site("test-site")
+        sent = mock_skyspark_client.update_points.call_args.args[0][0]
+
+        rows[2] = {**sent.model_dump(), "haystackRef": "pt-1"}
+        mock_skyspark_client.update_points.reset_mock()
+        mock_flightdeck_client.create_points.reset_mock()
+        result = await service.sync_points_for_site("test-site")
+
+        assert result.points_skipped == 1
+        mock_skyspark_client.update_points.assert_not_called()
+        mock_flightdeck_client.create_points.assert_not_called()
+
+    @pytest.mark.unit
+    async def test_skyspark_side_edit_is_written_back(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test a synced tag edited in SkySpark counts as a change and is updated."""
+        service, rows = self._unchanged_point_setup(
+            mock_flightdeck_client, mock_skyspark_client, self._ace_point("p1", "pt-1")
+        )
+        await service.sync_points_for_site("test-site")
+        sent = mock_skyspark_client.update_points.call_args.args[0][0]
+
+        rows[2] = {**sent.model_dump(), "haystackRef": "pt-1", "dis": "Edited in SkySpark"}
+        mock_skyspark_client.update_points.reset_mock()
+        result = await service.sync_points_for_site("test-site")
+
+        assert result.points_updated == 1
+        assert mock_skyspark_client.update_points.call_args.args[0][0].dis == "p1"
+
+    @pytest.mark.unit
+    async def test_fallback_skips_point_read_when_no_point_has_ref(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test the per-type fallback skips read_points when every ACE point is new."""
+        mock_skyspark_client.read.side_effect = RuntimeError("boom")
+        mock_skyspark_client.read_sites.return_value = [
+            {"id": {"val": "@site-1"}, "refName": "ace-site-test-site", "tz": "UTC"}
+        ]
+        mock_skyspark_client.read_equipment.return_value = [
+            {"id": {"val": "@equip-1"}, "refName": "ace-equip-10-1", "siteRef": {"val": "@site-1"}}
+        ]
+        mock_skyspark_client.create_points.return_value = [{"id": {"val": "@pt-1"}}]
+        mock_flightdeck_client.get_site_configured_points = MagicMock(
+            return_value={"items": [self._ace_point("p1")]}
+        )
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
+
+        result = await service.sync_points_for_site("test-site")
+
+        assert result.points_created == 1
+        mock_skyspark_client.read_points.assert_not_called()
+
+    @pytest.mark.unit
+    async def test_fallback_point_read_only_fetches_synced_points(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test the per-type fallback reads only SkySpark points that carry a haystackRef."""
+        mock_skyspark_client.read.side_effect = [
+            RuntimeError("boom"),
+            [{"id": {"val": "@pt-1"}, "haystackRef": "pt-1", "siteRef": {"val": "@site-1"}}],
+        ]
+        mock_skyspark_client.read_sites.return_value = [
+            {"id": {"val": "@site-1"}, "refName": "ace-site-test-site", "tz": "UTC"}
+        ]
+        mock_skyspark_client.read_equipment.return_value = [
+            {"id": {"val": "@equip-1"}, "refName": "ace-equip-10-1", "siteRef": {"val": "@site-1"}}
+        ]
+        mock_skyspark_client.update_points.return_value = [{"id": {"val": "@pt-1"}}]
+        mock_flightdeck_client.get_site_configured_points = MagicMock(
+            return_value={"items": [self._ace_point("p1", "pt-1")]}
+        )
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
+
+        result = await service.sync_points_for_site("test-site")
+
+        assert result.points_updated == 1
+        mock_skyspark_client.read.assert_awaited_with("point and haystackRef")
+        mock_skyspark_client.read_points.assert_not_called()
+
+    @pytest.mark.unit
+    async def test_sync_equipment_moves_equipment_to_current_site(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test existing equipment under another site is updated, matched equipment skipped."""
+        mock_skyspark_client.update_equipment = AsyncMock(return_value=[{"id": {"val": "@e-1"}}])
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
+        existing_equipment = [
+            {
+                "id": {"val": "@e-1"},
+                "refName": "ace-equip-10-1",
+                "siteRef": {"val": "@old-site"},
+                "mod": "2024-01-01T00:00:00Z",
+            },
+            {"id": {"val": "@e-2"}, "refName": "ace-equip-10-2", "siteRef": "@site-1"},
+        ]
+        ace_points = [
+            {"bacnet_data": {"device_address": "10", "device_id": 1}},
+            {"bacnet_data": {"device_address": "10", "device_id": 2}},
+        ]
+
+        ref_map, created, updated, skipped = await service._sync_equipment(
+            "test-site",
+            "site-1",
+            ace_points,
+            False,
+            "UTC",
+            existing_equipment=existing_equipment,
+        )
+
+        assert ref_map == {"10-1": "e-1", "10-2": "e-2"}
+        assert (created, updated, skipped) == (0, 1, 1)
+        (sent,) = mock_skyspark_client.update_equipment.call_args.args[0]
+        assert sent.id == "e-1"
+        assert sent.site_ref == "site-1"
+        mock_skyspark_client.create_equipment.assert_not_called()
+
+
+class TestSyncRefsFromSkyspark:
+    """Test writing SkySpark refs back to ACE."""
+
+    @pytest.mark.unit
+    async def test_sync_refs_parses_topics_and_filters_site(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test topics are split once, keeping slashes in the point name."""
+        mock_skyspark_client.read.return_value = [
+            {
+                "id": {"val": "@pt-1"},
+                "siteRef": {"val": "@site-1"},
+                "equipRef": {"val": "@equip-1"},
+                "tz": "New_York",
+                "ace_topic": "client/site-a/dev/ai-1",
+            },
+            {"id": {"val": "@pt-2"}, "ace_topic": "client/site-b/ai-2"},
+            {"id": {"val": "@pt-3"}, "ace_topic": "client/site-a"},
+        ]
+        service = PointSyncService(mock_flightdeck_client, mock_skyspark_client, make_config())
+
+        result = await service.sync_refs_from_skyspark(site="site-a")
+
+        mock_skyspark_client.read.assert_awaited_once_with("point and ace_topic")
+        mock_skyspark_client.read_points.assert_not_called()
+
+        assert result == {
+            "points_found": 2,
+            "refs_updated": 1,
+            "points_skipped": 1,
+            "errors": [],
+        }
+        (sent,) = mock_flightdeck_client.create_points.call_args.args[0]
+        assert sent["name"] == "dev/ai-1"
+        assert sent["client"] == "client"
+        assert sent["site"] == "site-a"
+        assert sent["kv_tags"]["haystackRef"] == "pt-1"
+        assert sent["kv_tags"]["haystack_equipRef"] == "equip-1"
+
+    @pytest.mark.unit
+    async def test_sync_refs_writes_in_batches_and_reports_failures(
+        self, mock_flightdeck_client: MagicMock, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test ref writes are chunked by batch_size and a failed chunk is reported."""
+        mock_skyspark_client.read.return_value = [
+            {"id": {"val": f"@pt-{n}"}, "ace_topic": f"client/site-a/ai-{n}"} for n in range(3)
+        ]
+        mock_flightdeck_client.create_points.side_effect = [None, RuntimeError("boom"), None]
+        service = PointSyncService(
+            mock_flightdeck_client, mock_skyspark_client, make_config(batch_size=1)
+        )
+
+        result = await service.sync_refs_from_skyspark()
+
+        assert mock_flightdeck_client.create_points.call_count == 3
+        assert result["refs_updated"] == 2
+        assert len(result["errors"]) == 1
+
+
+class TestRefValue:
+    """Test SkySpark ref value extraction."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("ref", "expected"),
+        [
+            ({"_kind": "ref", "val": "@p-1"}, "p-1"),
+            ({"_kind": "ref"}, ""),
+            ("@p-1", "p-1"),
+            ("p-1", "p-1"),
+            (None, ""),
+            ("", ""),
+        ],
+    )
+    def test_ref_value(self, ref: object, expected: str) -> None:
+        """Test dict, string and missing refs all yield the bare id."""
+        assert _ref_value(ref) == expected
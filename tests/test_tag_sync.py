@@ -1,7 +1,7 @@
 """Tests for tag synchronization between FlightDeck and SkySpark."""
 
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -16,7 +16,7 @@ class TestTagSynchronization:
     """Test tag synchronization from FlightDeck to SkySpark."""
 
     @pytest.mark.unit
-    async def test_sync_marker_tags(
+    def test_sync_marker_tags(
         self,
         mock_skyspark_client: MagicMock,  # noqa: ARG002
         sample_flightdeck_point: Any,  # noqa: ARG002
@@ -30,7 +30,7 @@ class TestTagSynchronization:
         assert "temp" in marker_tags
 
     @pytest.mark.unit
-    async def test_sync_kv_tags(self, mock_skyspark_client: MagicMock) -> None:  # noqa: ARG002
+    def test_sync_kv_tags(self, mock_skyspark_client: MagicMock) -> None:  # noqa: ARG002
         """Test syncing key-value tags from FlightDeck to SkySpark."""
         # FlightDeck tags
         fd_tags = {"sensor": None, "zone": "hvac", "floor": "2"}
@@ -104,7 +104,7 @@ class TestTagRemoval:
     """Test tag removal during synchronization."""
 
     @pytest.mark.unit
-    async def test_remove_tags_not_in_flightdeck(self, mock_skyspark_client: MagicMock) -> None:  # noqa: ARG002
+    def test_remove_tags_not_in_flightdeck(self, mock_skyspark_client: MagicMock) -> None:  # noqa: ARG002
         """Test removing tags that are not present in FlightDeck."""
 
         # SkySpark has extra tags
@@ -138,7 +138,7 @@ class TestBidirectionalTagSync:
     """Test bidirectional tag synchronization scenarios."""
 
     @pytest.mark.unit
-    async def test_flightdeck_to_skyspark_sync(self, sample_flightdeck_point: Any) -> None:
+    def test_flightdeck_to_skyspark_sync(self, sample_flightdeck_point: Any) -> None:
         """Test syncing tags from FlightDeck to SkySpark."""
         # FlightDeck is source of truth
         marker_tags = sample_flightdeck_point.marker_tags
@@ -156,7 +156,6 @@ class TestBidirectionalTagSync:
         skyspark_id = "p:aceTest:r:point-123"
 
         # Only haystackRef should be synced back
-        mock_flightdeck_client.update_point = AsyncMock()
         await mock_flightdeck_client.update_point(point_id, tags={"haystackRef": skyspark_id})
 
         # Verify only haystackRef updated
@@ -228,15 +227,11 @@ class TestTagValidation:
         # Invalid tag names
         invalid_names = ["", " ", "tag with spaces", "tag-with-special!@#"]
 
-        valid_names = []
-        for name in invalid_names:
-            # Tag names should be alphanumeric with underscores
-            is_valid = name.replace("_", "").isalnum() and len(name) > 0
-            if is_valid:
-                valid_names.append(name)
+        # Tag names should be alphanumeric with underscores ("".isalnum() is False)
+        valid_names = [name for name in invalid_names if name.replace("_", "").isalnum()]
 
         # None should be valid
-        assert len(valid_names) == 0
+        assert valid_names == []
 
 
 class TestTagSyncBatching:
@@ -259,7 +254,7 @@ class TestTagSyncBatching:
         mock_skyspark_client.update_points.assert_called_once()
 
     @pytest.mark.unit
-    async def test_chunk_large_tag_updates(self) -> None:
+    def test_chunk_large_tag_updates(self) -> None:
         """Test chunking large batches of tag updates."""
         # 100 points to update
         total_points = 100
@@ -289,7 +284,7 @@ class TestTagSyncWithHistory:
     """Test tag synchronization with history tracking."""
 
     @pytest.mark.unit
-    async def test_track_tag_changes(self) -> None:
+    def test_track_tag_changes(self) -> None:
         """Test tracking tag changes over time."""
         # Initial tags
         initial_tags = {"sensor": None, "temp": None}
@@ -298,12 +293,12 @@ class TestTagSyncWithHistory:
         updated_tags = {"sensor": None, "temp": None, "critical": None}
 
         # Detect changes
-        added_tags = set(updated_tags.keys()) - set(initial_tags.keys())
+        added_tags = updated_tags.keys() - initial_tags.keys()
 
         assert "critical" in added_tags
 
     @pytest.mark.unit
-    async def test_tag_sync_timestamp(self) -> None:
+    def test_tag_sync_timestamp(self) -> None:
         """Test recording timestamp of tag synchronization."""
         from datetime import UTC, datetime
 
@@ -1,7 +1,7 @@
 """Unit tests for haystackRef tagging logic."""
 
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -17,9 +17,6 @@ class TestHaystackRefTagging:
         point_id = "flightdeck-point-1"
         skyspark_id = "p:aceTest:r:point-123"
 
-        # Mock the update call
-        mock_flightdeck_client.update_point = AsyncMock()
-
         # Simulate tagging operation
         await mock_flightdeck_client.update_point(point_id, tags={"haystackRef": skyspark_id})
 
@@ -29,7 +26,7 @@ class TestHaystackRefTagging:
         )
 
     @pytest.mark.unit
-    async def test_skip_tagging_if_haystack_ref_exists(
+    def test_skip_tagging_if_haystack_ref_exists(
         self, sample_flightdeck_point_with_haystack_ref: Any
     ) -> None:
         """Test that points with existing haystackRef are skipped."""
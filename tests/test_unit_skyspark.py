@@ -6,6 +6,8 @@ from unittest.mock import MagicMock
 import pytest
 from ace_skyspark_lib import Equipment, Point, Site
 
+from tests.test_utils import build_ref_response
+
 
 class TestSiteCreation:
     """Test SkySpark site creation."""
@@ -36,7 +38,7 @@ class TestSiteCreation:
             Site(dis="Building C", tz="America/Los_Angeles", refName="site-c"),
         ]
 
-        mock_response = [{"id": {"val": f"p:aceTest:r:site-{i}"}} for i in range(len(sites))]
+        mock_response = build_ref_response("site", len(sites))
         mock_skyspark_client.create_sites.return_value = mock_response
 
         result = await mock_skyspark_client.create_sites(sites)
@@ -159,7 +161,7 @@ class TestPointCreation:
             for i in range(5)
         ]
 
-        mock_response = [{"id": {"val": f"p:aceTest:r:point-{i}"}} for i in range(len(points))]
+        mock_response = build_ref_response("point", len(points))
         mock_skyspark_client.create_points.return_value = mock_response
 
         result = await mock_skyspark_client.create_points(points)
@@ -215,7 +217,7 @@ class TestPointUpdates:
             for i in range(3)
         ]
 
-        mock_response = [{"id": {"val": f"p:aceTest:r:point-{i}"}} for i in range(len(points))]
+        mock_response = build_ref_response("point", len(points))
         mock_skyspark_client.update_points.return_value = mock_response
 
         result = await mock_skyspark_client.update_points(points)
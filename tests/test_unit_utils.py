@@ -1,18 +1,25 @@
 """Unit tests for utility functions."""
 
 from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 
 from tests.test_utils import (
+    build_ref_response,
     build_ref_string,
+    cleanup_ref_names,
     create_haystack_ref_tag,
+    delete_by_ids,
     extract_ref_id,
     find_by_ref_name,
     get_kv_tag,
     has_marker_tag,
+    index_by_ref_name,
     is_duplicate,
+    marker_tag_names,
     normalize_tags_from_flightdeck,
+    ref_names_filter,
 )
 
 
@@ -48,6 +55,16 @@ class TestRefStringUtils:
         ref = build_ref_string("aceTest", "abc123")
         assert ref == "p:aceTest:r:abc123"
 
+    @pytest.mark.unit
+    def test_build_ref_response(self) -> None:
+        """Test building an id-only response returns fresh rows per call."""
+        response = build_ref_response("site", 2)
+        assert response == [
+            {"id": {"val": "p:aceTest:r:site-0"}},
+            {"id": {"val": "p:aceTest:r:site-1"}},
+        ]
+        assert build_ref_response("site", 2) is not response
+
 
 class TestMarkerTags:
     """Test marker tag utility functions."""
@@ -70,6 +87,17 @@ class TestMarkerTags:
         entity = {"area": {"_kind": "number", "val": 5000}}
         assert has_marker_tag(entity, "area") is False
 
+    @pytest.mark.unit
+    def test_marker_tag_names(self) -> None:
+        """Test collecting every marker tag name on an entity."""
+        entity = {
+            "id": {"_kind": "ref", "val": "p:aceTest:r:1"},
+            "site": {"_kind": "marker"},
+            "hvac": {"_kind": "marker"},
+            "dis": "Test Site",
+        }
+        assert marker_tag_names(entity) == {"site", "hvac"}
+
 
 class TestKVTags:
     """Test key-value tag utility functions."""
@@ -186,6 +214,24 @@ class TestEntityFinding:
         found = find_by_ref_name(entities, "nonexistent")
         assert found is None
 
+    @pytest.mark.unit
+    def test_index_by_ref_name_keeps_first_match(self) -> None:
+        """Test the refName index agrees with find_by_ref_name."""
+        entities = [
+            {"id": {"val": "p:aceTest:r:1"}, "refName": "site-abc"},
+            {"id": {"val": "p:aceTest:r:2"}, "refName": "site-abc"},
+            {"id": {"val": "p:aceTest:r:3"}},
+        ]
+        index = index_by_ref_name(entities)
+        assert list(index) == ["site-abc"]
+        assert index["site-abc"] is find_by_ref_name(entities, "site-abc")
+
+    @pytest.mark.unit
+    def test_ref_names_filter_matches_any_ref_name(self) -> None:
+        """Test one filter covers several refNames."""
+        assert ref_names_filter(["a", "b"], "point") == 'point and (refName=="a" or refName=="b")'
+        assert ref_names_filter(["a"]) == '(refName=="a")'
+
     @pytest.mark.unit
     def test_is_duplicate_true(self) -> None:
         """Test duplicate detection."""
@@ -197,3 +243,43 @@ class TestEntityFinding:
         """Test non-duplicate detection."""
         entity = {"refName": "unique-name"}
         assert is_duplicate(entity, "different-name") is False
+
+    @pytest.mark.unit
+    async def test_cleanup_ref_names_reads_once_and_deletes_in_bulk(
+        self, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test cleanup issues one read and one bulk delete."""
+        existing = [{"id": {"val": "s1"}, "mod": "m1"}, {"id": {"val": "e1"}, "mod": "m2"}]
+        client = mock_skyspark_client
+        client.read.return_value = existing
+
+        await cleanup_ref_names(client, ["site", "equip"])
+
+        client.read.assert_awaited_once_with('(refName=="site" or refName=="equip")')
+        client.delete_entities.assert_awaited_once_with(existing)
+
+    @pytest.mark.unit
+    async def test_cleanup_ref_names_skips_delete_when_nothing_matches(
+        self, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test cleanup does not send an empty commit."""
+        client = mock_skyspark_client
+        client.read.return_value = []
+
+        await cleanup_ref_names(client, ["site"])
+
+        client.delete_entities.assert_not_awaited()
+
+    @pytest.mark.unit
+    async def test_delete_by_ids_raises_failures_after_trying_all(
+        self, mock_skyspark_client: MagicMock
+    ) -> None:
+        """Test one failed delete doesn't stop the others and is still reported."""
+        client = mock_skyspark_client
+        client.delete_entity.side_effect = [None, RuntimeError("stale"), None]
+
+        with pytest.raises(ExceptionGroup) as excinfo:
+            await delete_by_ids(client, ["p1", "e1", "s1"])
+
+        assert client.delete_entity.await_count == 3
+        assert [str(e) for e in excinfo.value.exceptions] == ["stale"]
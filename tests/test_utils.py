@@ -1,6 +1,15 @@
 """Test utilities and helper functions."""
 
-from typing import Any
+import asyncio
+from types import SimpleNamespace
+from typing import Any, cast
+
+from ace_skyspark_lib import Equipment, Site
+
+from ace_skyspark_cli.config import Config
+
+# Zinc value kinds whose payload lives under "val"
+_VAL_KINDS = frozenset({"number", "str", "bool", "date", "time", "datetime", "ref"})
 
 
 def extract_ref_id(ref_value: str | dict[str, Any]) -> str:
@@ -40,6 +49,22 @@ def build_ref_string(project: str, entity_id: str) -> str:
     return f"p:{project}:r:{entity_id}"
 
 
+def build_ref_response(prefix: str, count: int) -> list[dict[str, Any]]:
+    """
+    Build a SkySpark create/update response carrying only entity ids.
+
+    A new list is returned on each call so tests never share mutable rows.
+
+    Args:
+        prefix: Entity id prefix (e.g. "site" gives "p:aceTest:r:site-0", ...)
+        count: Number of rows
+
+    Returns:
+        Rows shaped like {"id": {"val": "p:aceTest:r:<prefix>-<i>"}}
+    """
+    return [{"id": {"val": build_ref_string("aceTest", f"{prefix}-{i}")}} for i in range(count)]
+
+
 def has_marker_tag(entity: dict[str, Any], tag: str) -> bool:
     """
     Check if an entity has a specific marker tag.
@@ -52,9 +77,24 @@ def has_marker_tag(entity: dict[str, Any], tag: str) -> bool:
         True if the marker tag exists
     """
     tag_value = entity.get(tag)
-    if tag_value is None:
-        return False
-    return bool(isinstance(tag_value, dict) and tag_value.get("_kind") == "marker")
+    return isinstance(tag_value, dict) and tag_value.get("_kind") == "marker"
+
+
+def marker_tag_names(entity: dict[str, Any]) -> frozenset[str]:
+    """
+    Collect the names of all marker tags on an entity.
+
+    Args:
+        entity: The SkySpark entity dict
+
+    Returns:
+        Names of tags whose value is a Zinc marker
+    """
+    return frozenset(
+        tag
+        for tag, value in entity.items()
+        if type(value) is dict and value.get("_kind") == "marker"
+    )
 
 
 def get_kv_tag(entity: dict[str, Any], tag: str) -> Any:
@@ -73,12 +113,8 @@ def get_kv_tag(entity: dict[str, Any], tag: str) -> Any:
         return None
 
     # Handle typed values
-    if isinstance(tag_value, dict):
-        kind = tag_value.get("_kind")
-        if kind in ("number", "str", "bool", "date", "time", "datetime"):
-            return tag_value.get("val")
-        if kind == "ref":
-            return tag_value.get("val")
+    if isinstance(tag_value, dict) and tag_value.get("_kind") in _VAL_KINDS:
+        return tag_value.get("val")
 
     return tag_value
 
@@ -134,12 +170,11 @@ def extract_haystack_ref(flightdeck_point: Any) -> str | None:
     Returns:
         The haystackRef value or None
     """
-    # Try kv_tags first (aceiot-models Point structure)
-    if hasattr(flightdeck_point, "kv_tags") and isinstance(flightdeck_point.kv_tags, dict):
-        return flightdeck_point.kv_tags.get("haystackRef")
-    # Fallback to tags attribute
-    if hasattr(flightdeck_point, "tags") and isinstance(flightdeck_point.tags, dict):
-        return flightdeck_point.tags.get("haystackRef")
+    # Try kv_tags first (aceiot-models Point structure), then fall back to tags
+    for attr in ("kv_tags", "tags"):
+        tags = getattr(flightdeck_point, attr, None)
+        if isinstance(tags, dict):
+            return tags.get("haystackRef")
     return None
 
 
@@ -160,6 +195,122 @@ def find_by_ref_name(entities: list[dict[str, Any]], ref_name: str) -> dict[str,
     return None
 
 
+def index_by_ref_name(entities: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """
+    Index entities by refName for repeated lookups.
+
+    Build once and use ``.get(ref_name)`` instead of calling find_by_ref_name per
+    lookup. Like find_by_ref_name, the first entity with a given refName wins.
+
+    Args:
+        entities: List of SkySpark entities
+
+    Returns:
+        Mapping of refName to entity (entities without a refName are skipped)
+    """
+    index: dict[str, dict[str, Any]] = {}
+    for entity in entities:
+        ref_name = entity.get("refName")
+        if ref_name is not None:
+            index.setdefault(ref_name, entity)
+    return index
+
+
+def ref_names_filter(ref_names: list[str], kind: str | None = None) -> str:
+    """
+    Build one Haystack filter matching any of several refNames.
+
+    Lets a single read replace one read per refName.
+
+    Args:
+        ref_names: The refNames to match
+        kind: Optional entity marker to require (e.g. "point")
+
+    Returns:
+        Filter such as 'point and (refName=="a" or refName=="b")'
+    """
+    any_ref_name = " or ".join(f'refName=="{ref_name}"' for ref_name in ref_names)
+    return f"{kind} and ({any_ref_name})" if kind else f"({any_ref_name})"
+
+
+async def delete_by_ids(client: Any, entity_ids: list[str]) -> None:
+    """
+    Delete several SkySpark entities concurrently by id.
+
+    Every delete is attempted even if some fail, so one stale id cannot block the
+    rest of a cleanup; the failures are then raised together.
+
+    Args:
+        client: Connected SkysparkClient
+        entity_ids: Ids of the entities to delete
+
+    Raises:
+        ExceptionGroup: One or more deletes failed
+    """
+    results = await asyncio.gather(
+        *(client.delete_entity(entity_id) for entity_id in entity_ids),
+        return_exceptions=True,
+    )
+    errors = [result for result in results if isinstance(result, Exception)]
+    if errors:
+        raise ExceptionGroup(
+            f"Failed to delete {len(errors)} of {len(entity_ids)} entities", errors
+        )
+
+
+async def cleanup_ref_names(client: Any, ref_names: list[str]) -> None:
+    """
+    Delete every SkySpark entity carrying one of the given refNames.
+
+    Uses one read for all refNames and one bulk commit to remove the matches.
+    The read rows carry both ``id`` and ``mod``, which the bulk delete needs.
+
+    Args:
+        client: Connected SkysparkClient
+        ref_names: The refNames to remove
+    """
+    existing = await client.read(ref_names_filter(ref_names))
+    if existing:
+        await client.delete_entities(existing)
+
+
+async def create_test_site_and_equip(
+    client: Any,
+    prefix: str,
+    label: str,
+    equip_markers: list[str] | None = None,
+) -> tuple[str, str]:
+    """
+    Create a fresh site and equipment for an integration test.
+
+    Entities left over from an earlier run under ``{prefix}-site``,
+    ``{prefix}-equip`` or ``{prefix}-point`` are removed first.
+
+    Args:
+        client: Connected SkysparkClient
+        prefix: refName prefix unique to the calling test
+        label: Display name prefix for the site and equipment
+        equip_markers: Equipment marker tags (defaults to equip and ahu)
+
+    Returns:
+        Tuple of (site_id, equip_id) as returned by SkySpark
+    """
+    await cleanup_ref_names(client, [f"{prefix}-site", f"{prefix}-equip", f"{prefix}-point"])
+
+    site = Site(dis=f"{label} Site", tz="America/New_York", refName=f"{prefix}-site")
+    created_sites = await client.create_sites([site])
+    site_id = created_sites[0]["id"]["val"]
+
+    equip = Equipment(
+        dis=f"{label} Equipment",
+        site_ref=site_id,
+        refName=f"{prefix}-equip",
+        marker_tags=equip_markers or ["equip", "ahu"],
+    )
+    created_equip = await client.create_equipment([equip])
+    return site_id, created_equip[0]["id"]["val"]
+
+
 def is_duplicate(entity: dict[str, Any], ref_name: str) -> bool:
     """
     Check if an entity is a duplicate based on refName.
@@ -172,3 +323,20 @@ def is_duplicate(entity: dict[str, Any], ref_name: str) -> bool:
         True if this is a duplicate
     """
     return entity.get("refName") == ref_name
+
+
+def make_config(**app_settings: object) -> Config:
+    """Build a stand-in Config carrying only the app settings the sync service reads.
+
+    A plain namespace is used instead of a Mock so that reading a setting the
+    helper does not define fails loudly rather than returning a Mock.
+    """
+    app = SimpleNamespace(
+        batch_size=100,
+        max_concurrent=5,
+        ace_rate_limit=0,
+        ace_max_retries=0,
+    )
+    for name, value in app_settings.items():
+        setattr(app, name, value)
+    return cast("Config", SimpleNamespace(app=app))